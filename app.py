@@ -2,24 +2,30 @@
 
 # pylint: disable=too-many-lines
 
+import atexit
 import itertools
 import json
 import os
+import queue
 import re
 import shutil
 import stat
 import subprocess
+import tempfile
 import threading
 import time
-import uuid
 import selectors
+from concurrent.futures import Future
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from collections import OrderedDict, deque
 from collections.abc import Iterable
-from typing import Any, Callable, Dict, List, Optional, Tuple
-
-from glob import glob as glob_paths
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
 
 import requests  # pylint: disable=import-error
+from requests.adapters import HTTPAdapter  # pylint: disable=import-error
+from urllib3.util.retry import Retry  # pylint: disable=import-error
 from flask import (  # pylint: disable=import-error
     Flask,
     Response,
@@ -29,19 +35,57 @@ from flask import (  # pylint: disable=import-error
     request,
     url_for,
 )
+from flask.json.provider import DefaultJSONProvider  # pylint: disable=import-error
 from yt_dlp import YoutubeDL  # pylint: disable=import-error
 from yt_dlp.extractor.youtube import YoutubeSearchIE  # pylint: disable=import-error
 from yt_dlp.utils import YoutubeDLError  # pylint: disable=import-error
 
-from jobs import JobRepository
+from jobs import JobLogBuffer, JobRepository
+
+try:
+    import orjson  # pylint: disable=import-error
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # pylint: disable=invalid-name
+
+
+def _json_loads(data: Any) -> Any:
+    """Decode JSON text or bytes, using orjson when it is installed.
+
+    orjson rejects the ``NaN``/``Infinity`` tokens yt-dlp can print for float
+    fields, so documents it refuses are retried with the stdlib parser.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.loads(data)  # pylint: disable=no-member
+        except orjson.JSONDecodeError:  # pylint: disable=no-member
+            pass
+    return json.loads(data)
+
+
+def _json_dumps_bytes(payload: Any) -> bytes:
+    """Encode a payload as compact UTF-8 JSON, using orjson when installed."""
+
+    if orjson is not None:
+        return orjson.dumps(payload)  # pylint: disable=no-member
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _json_dumps_pretty(payload: Any) -> str:
+    """Encode a payload as two-space indented JSON text."""
+
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2  # pylint: disable=no-member
+        return orjson.dumps(payload, option=option).decode("utf-8")  # pylint: disable=no-member
+    return json.dumps(payload, indent=2)
 
 
 @dataclass
 class JobControl:
     """Track runtime details for an active download worker."""
 
-    thread: threading.Thread
     cancel_event: threading.Event
+    future: Optional[Future] = None
     process: Optional[subprocess.Popen] = None
 
 
@@ -49,10 +93,103 @@ class JobCancelled(Exception):
     """Raised when a download job has been cancelled by the user."""
 
 
+class _DaemonThreadPool:  # pylint: disable=too-few-public-methods
+    """Run submitted callables on a bounded set of daemon threads.
+
+    ``ThreadPoolExecutor`` joins its workers when the interpreter exits, which
+    would make shutdown wait for every queued and running download. These
+    workers are daemons, like the per-job threads the app started before.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str) -> None:
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._queue: "queue.SimpleQueue[Tuple[Future, Callable[..., Any], tuple, dict]]" = (
+            queue.SimpleQueue()
+        )
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Queue ``fn(*args, **kwargs)`` and return its future."""
+
+        future: Future = Future()
+        self._queue.put((future, fn, args, kwargs))
+        with self._lock:
+            if len(self._threads) < self._max_workers:
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"{self._thread_name_prefix}_{len(self._threads)}",
+                    daemon=True,
+                )
+                self._threads.append(worker)
+                worker.start()
+        return future
+
+    def _work(self) -> None:
+        while True:
+            future, fn, args, kwargs = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:  # pylint: disable=broad-exception-caught
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+
 _JOB_CONTROLS: Dict[str, JobControl] = {}
 _JOB_CONTROLS_LOCK = threading.Lock()
 
+_EXECUTABLE_PATHS: Dict[str, str] = {}
+# Cookie files verified to exist with safe permissions, by check time.
+_VERIFIED_COOKIE_PATHS: Dict[str, float] = {}
+COOKIE_RECHECK_INTERVAL = 5.0
+
+_JOB_ID_BATCH_SIZE = 64
+_JOB_ID_STATE = threading.local()
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serve request and response bodies through orjson when it is installed."""
+
+    def _encode(self, obj: Any, *, sort_keys: bool, indent: bool) -> bytes:
+        # pylint: disable=no-member
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+        return self._encode(
+            obj,
+            sort_keys=kwargs.get("sort_keys", self.sort_keys),
+            indent=bool(kwargs.get("indent")),
+        ).decode("utf-8")
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # Hand orjson's bytes straight to the response instead of round-tripping
+        # them through a str, which matters for job payloads with long logs.
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        body = self._encode(obj, sort_keys=self.sort_keys, indent=indent)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if orjson is None:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)  # pylint: disable=no-member
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 CONFIG_BASE = os.environ.get("YT2RADARR_CONFIG_DIR", os.path.dirname(__file__))
 CONFIG_PATH = os.path.join(CONFIG_BASE, "config.json")
@@ -63,21 +200,94 @@ DEFAULT_COOKIE_FILENAME = "cookies.txt"
 # YouTube often serves low bitrate AV1 streams as "best", so bias toward
 # muxed or H.264/AAC combinations at the highest available resolution and only
 # allow other codecs when no higher quality HLS/H.264 options are available.
-YTDLP_FORMAT_SELECTOR = (
-    "bestvideo[height>=2160][vcodec^=avc1]+bestaudio[acodec^=mp4a]/"
-    "bestvideo[height>=1440][vcodec^=avc1]+bestaudio[acodec^=mp4a]/"
-    "bestvideo[height>=1080][vcodec^=avc1]+bestaudio[acodec^=mp4a]/"
-    "bestvideo[height>=720][vcodec^=avc1]+bestaudio[acodec^=mp4a]/"
-    "bestvideo[height>=2160]+bestaudio/"
-    "bestvideo[height>=1440]+bestaudio/"
-    "bestvideo[height>=1080]+bestaudio/"
-    "bestvideo[height>=720]+bestaudio/"
-    "95/"
-    "best"
-)
-METADATA_FETCH_TIMEOUT_SECONDS = 120
+_FORMAT_HEIGHT_LADDER = (2160, 1440, 1080, 720)
 
 
+def build_format_selector(max_height: Optional[int] = None) -> str:
+    """Return the yt-dlp format selector, optionally capped at ``max_height``.
+
+    Only the resolution tiers at or below the cap are emitted so yt-dlp has
+    fewer branches to evaluate against every available format.
+    """
+
+    cap = f"[height<={max_height}]" if max_height else ""
+    heights = [
+        height
+        for height in _FORMAT_HEIGHT_LADDER
+        if not max_height or height <= max_height
+    ]
+    branches = [
+        f"bestvideo[height>={height}]{cap}[vcodec^=avc1]+bestaudio[acodec^=mp4a]"
+        for height in heights
+    ]
+    branches += [f"bestvideo[height>={height}]{cap}+bestaudio" for height in heights]
+    if cap:
+        branches.append(f"bestvideo{cap}+bestaudio")
+    if not max_height or max_height >= 720:
+        # Format 95 is YouTube's 720p HLS stream.
+        branches.append("95")
+    branches.append(f"best{cap}")
+    return "/".join(branches)
+
+
+def _parse_positive_int(raw_value: Optional[str]) -> Optional[int]:
+    """Convert an optional positive integer setting, ignoring invalid values."""
+
+    try:
+        value = int(str(raw_value or "").strip())
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+YTDLP_MAX_HEIGHT = _parse_positive_int(os.environ.get("YT2RADARR_MAX_HEIGHT"))
+YTDLP_FORMAT_SELECTOR = build_format_selector(YTDLP_MAX_HEIGHT)
+# Fixed yt-dlp arguments; jobs only add the binary, cookies, playlist flag
+# and output/URL around them.
+_YTDLP_INFO_ARGS = ("-f", YTDLP_FORMAT_SELECTOR, "--skip-download")
+_YTDLP_DOWNLOAD_ARGS = ("--newline", "-f", YTDLP_FORMAT_SELECTOR)
+METADATA_FETCH_TIMEOUT_SECONDS = 120
+METADATA_CACHE_TTL = 300.0
+METADATA_CACHE_MAX_ITEMS = 32
+_PLAYLIST_ENTRY_TYPES = frozenset({"playlist", "multi_video", "multi"})
+
+_METADATA_CACHE: "OrderedDict[Tuple[Any, ...], Tuple[float, bytes, str]]" = OrderedDict()
+_METADATA_CACHE_LOCK = threading.Lock()
+
+
+MOVIES_CACHE_TTL = 60.0
+MOVIE_DETAIL_CACHE_TTL = 30.0
+MOVIE_DETAIL_CACHE_MAX_ITEMS = 64
+# Polling routes call load_config several times a second; only stat the file
+# this often to notice edits made outside the app.
+CONFIG_RECHECK_INTERVAL = 1.0
+# yt-dlp's output pipe is read through a buffer this large so bursts of
+# progress lines are drained in a few reads.
+SUBPROCESS_READ_BUFFER = 64 * 1024
+
+_UNSAFE_FILENAME_RE = re.compile(r'[\\/:*?"<>|]+')
+_EXTRA_TYPE_STRIP_RE = re.compile(r"[^a-z]")
+_YOUTUBE_URL_RE = re.compile(r"(?:youtube\.com|youtu\.be)/")
+_RADARR_URL_RE = re.compile(r"https?://")
+_PROGRESS_RE = re.compile(r"(\d{1,3}(?:\.\d+)?)%")
+# Classify yt-dlp output lines without lowercasing a copy of each one.
+_OUTPUT_ERROR_RE = re.compile("error", re.IGNORECASE)
+_OUTPUT_WARNING_RE = re.compile("warning", re.IGNORECASE)
+_OUTPUT_DEBUG_PREFIX_RE = re.compile(
+    r"\[(?:debug|info|extractor|metadata|youtube)\]", re.IGNORECASE
+)
+# Failures that mean the saved metadata itself was unusable, such as an
+# unreadable info JSON or stream URLs that have expired since extraction.
+_INFO_JSON_RETRY_RE = re.compile(
+    r"HTTP Error 4(?:03|10)\b|info[ _-]?json|JSONDecodeError", re.IGNORECASE
+)
+_JSON_DECODER = json.JSONDecoder()
+# Format details recorded on a job; replaced once the real output is known.
+_FORMAT_METADATA_RE = re.compile(
+    r"(?:format|format id|resolution|video codec|audio codec|filesize):",
+    re.IGNORECASE,
+)
+_CONCAT_ESCAPE = str.maketrans({"\\": "\\\\", "'": "\\'"})
 
 YOUTUBE_SEARCH_MAX_RESULTS = 20
 YOUTUBE_SEARCH_CACHE_TTL = 90.0
@@ -96,6 +306,11 @@ YOUTUBE_SEARCH_DL_OPTIONS = {
     "extractor_retries": 0,
     "nocheckcertificate": True,
 }
+
+
+_FILESIZE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB")
+
+
 def _format_filesize(value: Optional[float]) -> str:
     """Return a human-readable string for a byte size."""
 
@@ -107,12 +322,11 @@ def _format_filesize(value: Optional[float]) -> str:
         return "unknown"
     if size <= 0:
         return "unknown"
-    units = ["B", "KiB", "MiB", "GiB", "TiB"]
     unit_index = 0
-    while size >= 1024 and unit_index < len(units) - 1:
+    while size >= 1024 and unit_index < len(_FILESIZE_UNITS) - 1:
         size /= 1024
         unit_index += 1
-    return f"{size:.1f} {units[unit_index]}"
+    return f"{size:.1f} {_FILESIZE_UNITS[unit_index]}"
 def _default_config() -> Dict:
     return {
         "radarr_url": (os.environ.get("RADARR_URL") or "").rstrip("/"),
@@ -124,34 +338,99 @@ def _default_config() -> Dict:
     }
 
 
-_CACHE: Dict[str, Optional[Any]] = {"config": None, "movies": None}
+_CACHE: Dict[str, Optional[Any]] = {
+    "config": None,
+    "config_signature": None,
+    "config_checked": 0.0,
+    "movies": None,
+    "configured": None,
+    "library_index": None,
+    "index_page": None,
+}
+_CONFIG_LOCK = threading.Lock()
+_MOVIE_DETAIL_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, Dict]]" = OrderedDict()
+_MOVIE_DETAIL_CACHE_LOCK = threading.Lock()
+
+
+def _build_http_session() -> requests.Session:
+    """Return a keep-alive session with a small connection pool for Radarr."""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            connect=2,
+            read=1,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_HTTP_SESSION = _build_http_session()
+# (connect, read) seconds. The session retries a failed connect twice, so the
+# connect timeout is kept short: an unreachable Radarr still fails in about
+# the time one 10 second attempt used to take.
+RADARR_TIMEOUT = (3.05, 10)
+
+_IO_POOL = _DaemonThreadPool(max_workers=8, thread_name_prefix="yt2radarr-io")
+# Request handlers block on these Radarr calls, so they get their own workers.
+_RADARR_POOL = _DaemonThreadPool(max_workers=4, thread_name_prefix="yt2radarr-radarr")
+
+# Downloads run on a fixed pool so a burst of submissions waits in the
+# "queued" state instead of starting every yt-dlp/ffmpeg process at once.
+MAX_CONCURRENT_JOBS = (
+    _parse_positive_int(os.environ.get("YT2RADARR_MAX_CONCURRENT_JOBS")) or 2
+)
+_JOB_POOL = _DaemonThreadPool(
+    max_workers=MAX_CONCURRENT_JOBS, thread_name_prefix="yt2radarr-job"
+)
+# Each running job has at most one metadata query in flight, so these slow
+# yt-dlp calls never queue behind each other or behind _IO_POOL work.
+_METADATA_POOL = _DaemonThreadPool(
+    max_workers=MAX_CONCURRENT_JOBS, thread_name_prefix="yt2radarr-metadata"
+)
 
-jobs_repo = JobRepository(JOBS_PATH, max_items=50)
+jobs_repo = JobRepository(JOBS_PATH, max_items=50, flush_interval=0.5)
+job_logs = JobLogBuffer(jobs_repo)
+# atexit runs handlers in reverse order: flush buffered logs, then job history.
+atexit.register(jobs_repo.flush)
+atexit.register(job_logs.flush)
 
 
 def append_job_log(job_id: str, message: str) -> None:
     """Append a single log message to the given job."""
-    jobs_repo.append_logs(job_id, [message])
+    job_logs.append(job_id, message)
 
 
 def replace_job_log(job_id: str, message: str) -> None:
     """Replace the most recent log entry for a job."""
-    jobs_repo.replace_last_log(job_id, message)
+    job_logs.replace_last(job_id, message)
 
 
 def _mark_job_failure(job_id: str, message: str) -> None:
     """Mark the specified job as failed."""
+    job_logs.flush(job_id)
     jobs_repo.mark_failure(job_id, message)
 
 
 def _mark_job_success(job_id: str) -> None:
     """Mark the specified job as successful."""
+    job_logs.flush(job_id)
     jobs_repo.mark_success(job_id)
 
 
 def _mark_job_cancelled(job_id: str, message: str = "Job cancelled by user.") -> None:
     """Mark the specified job as cancelled."""
 
+    job_logs.flush(job_id)
     jobs_repo.mark_cancelled(job_id, message)
 
 
@@ -160,16 +439,44 @@ def _job_status(job_id: str, status: str, progress: Optional[float] = None) -> N
     jobs_repo.status(job_id, status, progress=progress)
 
 
-def _register_job_control(
-    job_id: str, worker: threading.Thread, cancel_event: threading.Event
-) -> None:
-    """Store the worker and cancellation event for an active job."""
+def _new_job_id() -> str:
+    """Return a random UUID4 string using a per-thread batch of OS entropy."""
+
+    buffer = getattr(_JOB_ID_STATE, "buffer", b"")
+    offset = getattr(_JOB_ID_STATE, "offset", 0)
+    if offset + 16 > len(buffer):
+        buffer = os.urandom(16 * _JOB_ID_BATCH_SIZE)
+        offset = 0
+        _JOB_ID_STATE.buffer = buffer
+    _JOB_ID_STATE.offset = offset + 16
+    # Stamp the version 4 and RFC 4122 variant bits and format the hex
+    # directly instead of constructing a uuid.UUID for every job.
+    raw = bytearray(buffer[offset : offset + 16])
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    digits = raw.hex()
+    return (
+        f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+    )
+
 
-    control = JobControl(thread=worker, cancel_event=cancel_event)
+def _register_job_control(job_id: str, cancel_event: threading.Event) -> None:
+    """Store the cancellation event for an active job."""
+
+    control = JobControl(cancel_event=cancel_event)
     with _JOB_CONTROLS_LOCK:
         _JOB_CONTROLS[job_id] = control
 
 
+def _set_job_future(job_id: str, future: Future) -> None:
+    """Record the pool future running the specified job."""
+
+    with _JOB_CONTROLS_LOCK:
+        control = _JOB_CONTROLS.get(job_id)
+        if control is not None:
+            control.future = future
+
+
 def _set_job_process(job_id: str, process: Optional[subprocess.Popen]) -> None:
     """Record the active subprocess for a running job."""
 
@@ -213,19 +520,117 @@ def _terminate_process(process: Optional[subprocess.Popen]) -> None:
             pass
 
 
-def _cleanup_temp_files(pattern: Optional[str]) -> None:
+def _abandon_active_jobs() -> None:
+    """Stop unfinished jobs at exit and record them as failed."""
+
+    with _JOB_CONTROLS_LOCK:
+        controls = list(_JOB_CONTROLS.items())
+        _JOB_CONTROLS.clear()
+    for job_id, control in controls:
+        control.cancel_event.set()
+        if control.future is not None:
+            control.future.cancel()
+        if control.process is not None:
+            # Signal only; waiting on every child would stall the exit.
+            try:
+                control.process.terminate()
+            except OSError:
+                pass
+        append_job_log(job_id, "Job interrupted because the server is shutting down.")
+        _mark_job_failure(job_id, "Interrupted by server shutdown.")
+
+
+# Registered after the flush hooks so it runs before them.
+atexit.register(_abandon_active_jobs)
+
+
+def _scan_download_outputs(expected: Optional[Tuple[str, str]]) -> List[os.DirEntry]:
+    """Return the entries yt-dlp may have written for ``(directory, stem)``.
+
+    Entries named ``stem.*`` are returned; an empty stem matches every
+    non-hidden name with an extension, like a ``*.*`` glob would.
+    """
+
+    if not expected:
+        return []
+    directory, stem = expected
+    prefix = f"{stem}."
+    matches: List[os.DirEntry] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if stem:
+                    if name.startswith(prefix):
+                        matches.append(entry)
+                elif not name.startswith(".") and "." in name:
+                    matches.append(entry)
+    except OSError:
+        return []
+    return matches
+
+
+def _find_executable(name: str) -> Optional[str]:
+    """Return the absolute path of ``name`` on PATH, remembering hits.
+
+    A remembered path is reused while it is still executable, so the PATH
+    walk only repeats when a binary moves or has not been found yet.
+    """
+
+    cached = _EXECUTABLE_PATHS.get(name)
+    if cached and os.access(cached, os.X_OK):
+        return cached
+    resolved = shutil.which(name)
+    if resolved:
+        _EXECUTABLE_PATHS[name] = resolved
+    else:
+        _EXECUTABLE_PATHS.pop(name, None)
+    return resolved
+
+
+def _cleanup_temp_files(expected: Optional[Tuple[str, str]]) -> None:
     """Remove temporary download fragments produced by yt-dlp."""
 
-    if not pattern:
-        return
-    for leftover in glob_paths(pattern):
-        if leftover.endswith((".part", ".ytdl")):
+    for leftover in _scan_download_outputs(expected):
+        if leftover.name.endswith((".part", ".ytdl")):
             try:
-                os.remove(leftover)
+                os.remove(leftover.path)
             except OSError:
                 continue
 
 
+def _existing_names(directory: str) -> Set[str]:
+    """Return the names of every entry in ``directory`` from one scan."""
+
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def _existing_stems(directory: str) -> Set[str]:
+    """Return every ``stem`` for which ``directory`` holds a ``stem.*`` entry.
+
+    A name such as ``Movie.en.srt`` yields both ``Movie`` and ``Movie.en`` so
+    membership matches what a ``stem.*`` glob would find, without treating
+    glob metacharacters in the stem specially.
+    """
+
+    stems: Set[str] = set()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                dot = name.find(".", 1)
+                while dot != -1:
+                    stems.add(name[:dot])
+                    dot = name.find(".", dot + 1)
+    except OSError:
+        pass
+    return stems
+
+
 def _normalise_youtube_result(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Convert a YouTube search entry into the structure expected by the UI."""
 
@@ -329,25 +734,64 @@ def _search_youtube(query: str, limit: int = 10) -> List[Dict[str, Any]]:
     return results
 
 
+def _escape_concat_path(value: str) -> str:
+    """Escape a path for a quoted ``file`` line in an ffmpeg concat manifest."""
+
+    return value.translate(_CONCAT_ESCAPE)
+
+
 def _cleanup_playlist_dir(path: Optional[str]) -> None:
-    """Remove the temporary playlist staging directory if it exists."""
+    """Remove the temporary playlist staging directory in the background.
+
+    Staging directories can hold every clip of a playlist, so the unlinks run
+    on the I/O pool instead of delaying the job's final status update.
+    """
 
     if path and os.path.isdir(path):
-        shutil.rmtree(path, ignore_errors=True)
-
-def _sum_requested_filesizes(formats: Iterable[Dict[str, Any]]) -> Optional[float]:
-    """Return the combined size of the requested formats when available."""
-
-    total = 0.0
-    found = False
-    for entry in formats:
-        for key in ("filesize", "filesize_approx"):
-            candidate = entry.get(key)
-            if isinstance(candidate, (int, float)) and candidate > 0:
-                total += float(candidate)
-                found = True
-                break
-    return total if found else None
+        _IO_POOL.submit(shutil.rmtree, path, ignore_errors=True)
+
+def _parse_metadata_entries(output: bytes) -> List[Dict[str, Any]]:
+    """Decode the JSON objects printed by ``yt-dlp --print-json``.
+
+    The raw stdout bytes are handed to the JSON parser line by line so the
+    full output never has to be decoded into an intermediate string. Lines
+    that cannot start a JSON object are skipped without attempting a decode.
+    When no line parses, fall back to decoding a single object starting at
+    the first ``{`` in the output.
+    """
+
+    entries: List[Dict[str, Any]] = []
+    for raw_line in output.splitlines():
+        stripped = raw_line.strip()
+        if not stripped.startswith(b"{"):
+            continue
+        try:
+            parsed_line = _json_loads(stripped)
+        except ValueError:
+            continue
+        if isinstance(parsed_line, dict):
+            entries.append(parsed_line)
+
+    if not entries:
+        start = output.find(b"{")
+        if start != -1:
+            text = output[start:].decode("utf-8", errors="replace")
+            try:
+                parsed_blob, _ = _JSON_DECODER.raw_decode(text)
+            except json.JSONDecodeError:
+                parsed_blob = None
+            if isinstance(parsed_blob, dict):
+                entries.append(parsed_blob)
+    return entries
+
+
+def _has_video_entry(lines: bytes) -> bool:
+    """Return whether the complete JSON lines in ``lines`` include a video entry."""
+
+    for entry in _parse_metadata_entries(lines):
+        if str(entry.get("_type") or "video").lower() not in _PLAYLIST_ENTRY_TYPES:
+            return True
+    return False
 
 
 def _derive_dimensions(
@@ -379,37 +823,34 @@ def _summarize_requested_formats(
 ) -> Dict[str, str]:
     """Build a summary for the requested video and audio formats."""
 
-    video_format = next(
-        (
-            entry
-            for entry in requested_formats
-            if entry.get("vcodec") not in (None, "none")
-        ),
-        None,
-    )
-    audio_format = next(
-        (
-            entry
-            for entry in requested_formats
-            if entry.get("acodec") not in (None, "none")
-        ),
-        None,
-    )
-    format_ids = [
-        entry.get("format_id")
-        for entry in requested_formats
-        if entry.get("format_id")
-    ]
+    video_format: Optional[Dict[str, Any]] = None
+    audio_format: Optional[Dict[str, Any]] = None
+    format_ids: List[str] = []
+    total_size = 0.0
+    size_found = False
+    for entry in requested_formats:
+        if video_format is None and entry.get("vcodec") not in (None, "none"):
+            video_format = entry
+        if audio_format is None and entry.get("acodec") not in (None, "none"):
+            audio_format = entry
+        format_id = entry.get("format_id")
+        if format_id:
+            format_ids.append(format_id)
+        size = entry.get("filesize")
+        if not (isinstance(size, (int, float)) and size > 0):
+            size = entry.get("filesize_approx")
+        if isinstance(size, (int, float)) and size > 0:
+            total_size += float(size)
+            size_found = True
     width_value, height_value = _derive_dimensions(video_format, info_payload)
     vcodec_value = (video_format or {}).get("vcodec") or info_payload.get("vcodec")
     acodec_value = (audio_format or {}).get("acodec") or info_payload.get("acodec")
-    total_size = _sum_requested_filesizes(requested_formats)
     return {
         "format_id": "+".join(format_ids) if format_ids else "unknown",
         "resolution": _format_resolution(width_value, height_value),
         "video_codec": vcodec_value or "unknown",
         "audio_codec": acodec_value or "unknown",
-        "filesize": _format_filesize(total_size),
+        "filesize": _format_filesize(total_size if size_found else None),
     }
 
 
@@ -453,36 +894,51 @@ _ESSENTIAL_PHRASES = (
 )
 
 
+_NOISY_WARNING_RE = re.compile(
+    "|".join(re.escape(snippet) for snippet in _NOISY_WARNING_SNIPPETS),
+    re.IGNORECASE,
+)
+# Classify a log line in one scan. The anchored prefixes win at the start of
+# the line: debug lines are hidden, warnings are checked for noise and the
+# other prefixes are always shown. Otherwise a line is shown only when it
+# contains an essential phrase.
+_DISPLAY_CLASS_RE = re.compile(
+    r"(?P<debug>^debug:)|(?P<warning>^warning:)"
+    r"|^(?:error:|\[(?:download|ffmpeg|merger)\])|"
+    + "|".join(re.escape(phrase) for phrase in _ESSENTIAL_PHRASES),
+    re.IGNORECASE,
+)
+
+
 def _filter_logs_for_display(logs: Iterable[str], debug_mode: bool) -> List[str]:
+    stripped = (str(raw).strip() for raw in logs or [])
+    if debug_mode:
+        return [line for line in stripped if line]
+
     filtered: List[str] = []
-    for raw in logs or []:
-        text = str(raw)
-        trimmed = text.strip()
+    for trimmed in stripped:
         if not trimmed:
             continue
-        if debug_mode:
-            filtered.append(trimmed)
+        match = _DISPLAY_CLASS_RE.search(trimmed)
+        if match is None or match.lastgroup == "debug":
             continue
-
-        lowered = trimmed.lower()
-        if lowered.startswith("debug:"):
+        if match.lastgroup == "warning" and _NOISY_WARNING_RE.search(trimmed):
             continue
+        filtered.append(trimmed)
 
-        if lowered.startswith("warning:") and any(
-            snippet in lowered for snippet in _NOISY_WARNING_SNIPPETS
-        ):
-            continue
+    return filtered
 
-        if lowered.startswith(
-            ("error:", "warning:", "[download]", "[ffmpeg]", "[merger]")
-        ):
-            filtered.append(trimmed)
-            continue
 
-        if any(phrase in lowered for phrase in _ESSENTIAL_PHRASES):
-            filtered.append(trimmed)
+@lru_cache(maxsize=256)
+def _absolute_local_path(path: str) -> str:
+    """Return an absolute local path, expanding ``~`` only when it is present.
 
-    return filtered if filtered else []
+    The app never changes its working directory, so results are memoized.
+    """
+
+    if path.startswith("~"):
+        path = os.path.expanduser(path)
+    return os.path.abspath(path)
 
 
 def _normalize_override_entry(entry: Dict[str, str]) -> Optional[Dict[str, str]]:
@@ -490,12 +946,12 @@ def _normalize_override_entry(entry: Dict[str, str]) -> Optional[Dict[str, str]]
 
     if not isinstance(entry, dict):
         return None
-    remote = str(entry.get("remote") or "").strip()
-    local = str(entry.get("local") or "").strip()
+    remote = _clean_text(entry.get("remote"))
+    local = _clean_text(entry.get("local"))
     if not remote or not local:
         return None
     remote_clean = remote.rstrip("/\\") or remote
-    local_clean = os.path.abspath(os.path.expanduser(local))
+    local_clean = _absolute_local_path(local)
     return {"remote": remote_clean, "local": local_clean}
 
 
@@ -503,10 +959,16 @@ def normalize_path_overrides(overrides: List[Dict[str, str]]) -> List[Dict[str,
     """Sanitize and de-duplicate path override entries."""
 
     normalized: List[Dict[str, str]] = []
+    seen: Set[Tuple[str, str]] = set()
     for entry in overrides:
         record = _normalize_override_entry(entry)
-        if record and record not in normalized:
-            normalized.append(record)
+        if not record:
+            continue
+        key = (record["remote"], record["local"])
+        if key in seen:
+            continue
+        seen.add(key)
+        normalized.append(record)
     return normalized
 
 
@@ -523,9 +985,10 @@ def _normalize_loaded_config(raw_config: Optional[Dict]) -> Dict:
     file_paths = merged.get("file_paths", [])
     if not isinstance(file_paths, list):
         file_paths = [str(file_paths)] if file_paths else []
-    merged["file_paths"] = [
-        os.path.abspath(os.path.expanduser(str(path))) for path in file_paths
-    ]
+    # Drop repeated library paths so folder scans visit each one once.
+    merged["file_paths"] = list(
+        dict.fromkeys(_absolute_local_path(str(path)) for path in file_paths)
+    )
 
     overrides_raw = merged.get("path_overrides", [])
     if not isinstance(overrides_raw, list):
@@ -544,39 +1007,136 @@ def _normalize_loaded_config(raw_config: Optional[Dict]) -> Dict:
     return merged
 
 
+def _config_signature() -> Optional[Tuple[int, int]]:
+    """Return the modification time and size of the config file, if present."""
+
+    try:
+        status = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return status.st_mtime_ns, status.st_size
+
+
 def load_config() -> Dict:
-    """Load configuration from disk or environment defaults."""
+    """Load configuration from disk or environment defaults.
+
+    The parsed configuration is cached and only re-read when the file's
+    modification time or size changes. The file is checked at most once per
+    ``CONFIG_RECHECK_INTERVAL`` seconds.
+    """
 
+    now = time.monotonic()
     cached_config = _CACHE.get("config")
-    if isinstance(cached_config, dict):
+    if (
+        isinstance(cached_config, dict)
+        and now - _CACHE["config_checked"] < CONFIG_RECHECK_INTERVAL
+    ):
+        return cached_config
+
+    signature = _config_signature()
+    if isinstance(cached_config, dict) and _CACHE.get("config_signature") == signature:
+        _CACHE["config_checked"] = now
         return cached_config
 
-    config_data: Optional[Dict] = None
+    with _CONFIG_LOCK:
+        cached_config = _CACHE.get("config")
+        if isinstance(cached_config, dict) and _CACHE.get("config_signature") == signature:
+            return cached_config
+
+        config_data: Optional[Dict] = None
+        try:
+            with open(CONFIG_PATH, "rb") as handle:
+                loaded = _json_loads(handle.read())
+                if not isinstance(loaded, dict):
+                    raise ValueError("Invalid configuration format")
+                config_data = loaded
+        except FileNotFoundError:
+            config_data = None
+        except (OSError, json.JSONDecodeError) as exc:  # pragma: no cover - configuration file errors
+            print(f"Failed to load configuration: {exc}")
+            config_data = None
+
+        config = _normalize_loaded_config(config_data)
+        if isinstance(cached_config, dict):
+            # The file changed underneath us; Radarr settings may differ now.
+            _CACHE["movies"] = None
+        _CACHE["config"] = config
+        _CACHE["config_signature"] = signature
+        _CACHE["config_checked"] = now
+        _CACHE["configured"] = is_configured(config)
+        return config
+
+
+def _write_file_atomic(path: str, text: str, mode: int = 0o666) -> None:
+    """Write text to a temporary sibling file and rename it over ``path``.
+
+    Each call gets its own temporary file, so concurrent saves never write
+    into the same file before it is renamed into place. A new file is
+    created with ``mode`` (subject to the umask). An existing file keeps its
+    permissions, never looser than ``mode``, and its owner when running as
+    root.
+    """
+
     try:
-        with open(CONFIG_PATH, "r", encoding="utf-8") as handle:
-            loaded = json.load(handle)
-            if not isinstance(loaded, dict):
-                raise ValueError("Invalid configuration format")
-            config_data = loaded
-    except FileNotFoundError:
-        config_data = None
-    except (OSError, json.JSONDecodeError) as exc:  # pragma: no cover - configuration file errors
-        print(f"Failed to load configuration: {exc}")
-        config_data = None
-
-    config = _normalize_loaded_config(config_data)
-    _CACHE["config"] = config
-    return config
+        existing: Optional[os.stat_result] = os.stat(path)
+    except OSError:
+        existing = None
+
+    directory, name = os.path.split(path)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0)
+    while True:
+        tmp_path = os.path.join(directory, f".{name}.{os.urandom(6).hex()}.tmp")
+        try:
+            fd = os.open(tmp_path, flags, mode)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            if existing is not None:
+                os.chmod(tmp_path, stat.S_IMODE(existing.st_mode) & mode)
+                if hasattr(os, "geteuid") and os.geteuid() == 0:
+                    os.chown(tmp_path, existing.st_uid, existing.st_gid)
+            handle.write(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 def save_config(config: Dict) -> None:
-    """Persist configuration to disk and reset caches."""
+    """Persist configuration to disk and reset caches that depend on it.
+
+    An unchanged file is not rewritten, and the Radarr movie caches are kept
+    unless the server URL or API key changed.
+    """
 
-    os.makedirs(os.path.dirname(CONFIG_PATH) or ".", exist_ok=True)
-    with open(CONFIG_PATH, "w", encoding="utf-8") as handle:
-        json.dump(config, handle, indent=2)
+    previous = _CACHE.get("config")
+    text = _json_dumps_pretty(config)
+    try:
+        with open(CONFIG_PATH, "r", encoding="utf-8") as handle:
+            unchanged = handle.read() == text
+    except (OSError, UnicodeDecodeError):
+        unchanged = False
+    if not unchanged:
+        os.makedirs(os.path.dirname(CONFIG_PATH) or ".", exist_ok=True)
+        _write_file_atomic(CONFIG_PATH, text)
     _CACHE["config"] = config
-    _CACHE["movies"] = None
+    _CACHE["config_signature"] = _config_signature()
+    _CACHE["config_checked"] = time.monotonic()
+    _CACHE["configured"] = is_configured(config)
+    if not isinstance(previous, dict) or any(
+        previous.get(key) != config.get(key) for key in ("radarr_url", "radarr_api_key")
+    ):
+        _CACHE["movies"] = None
+        with _MOVIE_DETAIL_CACHE_LOCK:
+            _MOVIE_DETAIL_CACHE.clear()
+    _CACHE["library_index"] = None
 
 
 def is_configured(config: Optional[Dict] = None) -> bool:
@@ -590,12 +1150,14 @@ def normalize_paths(raw_paths: str) -> List[str]:
     """Convert newline-separated paths into cleaned absolute paths."""
 
     paths: List[str] = []
+    seen: Set[str] = set()
     for line in raw_paths.splitlines():
         cleaned = line.strip()
         if not cleaned:
             continue
-        expanded = os.path.abspath(os.path.expanduser(cleaned))
-        if expanded not in paths:
+        expanded = _absolute_local_path(cleaned)
+        if expanded not in seen:
+            seen.add(expanded)
             paths.append(expanded)
     return paths
 
@@ -635,11 +1197,14 @@ def parse_path_overrides(raw_overrides: str) -> Tuple[List[Dict[str, str]], List
     return overrides, errors
 
 
+@lru_cache(maxsize=8)
 def _cookie_absolute_path(cookie_file: str) -> str:
     """Return an absolute cookie file path for a configured value."""
     if not cookie_file:
         return ""
-    expanded = os.path.expanduser(cookie_file)
+    expanded = cookie_file
+    if expanded.startswith("~"):
+        expanded = os.path.expanduser(expanded)
     if os.path.isabs(expanded):
         return os.path.abspath(expanded)
     return os.path.abspath(os.path.join(CONFIG_BASE, expanded))
@@ -658,21 +1223,46 @@ def _secure_cookie_file(path: str) -> None:
         pass
 
 
+def _cookie_is_secured(mode: int) -> bool:
+    """Return True when a cookie file already has the restrictive permissions."""
+    if os.name == "nt":
+        return False
+    return stat.S_IMODE(mode) == 0o600
+
+
+def _existing_cookie_path(absolute: str) -> str:
+    """Return the path when the cookie file exists, tightening its permissions.
+
+    A file that passed the check is trusted for ``COOKIE_RECHECK_INTERVAL``
+    seconds so back-to-back jobs do not stat and chmod it again.
+    """
+    if not absolute:
+        return ""
+    now = time.monotonic()
+    verified_at = _VERIFIED_COOKIE_PATHS.get(absolute)
+    if verified_at is not None and now - verified_at < COOKIE_RECHECK_INTERVAL:
+        return absolute
+    try:
+        status = os.stat(absolute)
+    except OSError:
+        _VERIFIED_COOKIE_PATHS.pop(absolute, None)
+        return ""
+    if not _cookie_is_secured(status.st_mode):
+        _secure_cookie_file(absolute)
+    _VERIFIED_COOKIE_PATHS[absolute] = now
+    return absolute
+
+
 def get_cookie_path(config: Optional[Dict] = None) -> str:
     """Locate the cookie file, preferring environment overrides."""
     env_path = os.environ.get("YT_COOKIE_FILE")
     if env_path:
-        absolute = _cookie_absolute_path(env_path)
-        if os.path.exists(absolute):
-            _secure_cookie_file(absolute)
+        absolute = _existing_cookie_path(_cookie_absolute_path(env_path))
+        if absolute:
             return absolute
     cfg = config or load_config()
     cookie_file = str(cfg.get("cookie_file") or "").strip()
-    absolute = _cookie_absolute_path(cookie_file)
-    if absolute and os.path.exists(absolute):
-        _secure_cookie_file(absolute)
-        return absolute
-    return ""
+    return _existing_cookie_path(_cookie_absolute_path(cookie_file))
 
 
 def save_cookie_text(raw_text: str) -> str:
@@ -680,11 +1270,10 @@ def save_cookie_text(raw_text: str) -> str:
     os.makedirs(CONFIG_BASE or ".", exist_ok=True)
     cookie_file = DEFAULT_COOKIE_FILENAME
     target_path = _cookie_absolute_path(cookie_file)
-    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
     mode = 0o600 if os.name != "nt" else 0o666
-    with os.fdopen(os.open(target_path, flags, mode), "w", encoding="utf-8") as handle:
-        handle.write(raw_text.strip() + "\n")
+    _write_file_atomic(target_path, raw_text.strip() + "\n", mode)
     _secure_cookie_file(target_path)
+    _VERIFIED_COOKIE_PATHS.pop(target_path, None)
     return cookie_file
 
 
@@ -693,6 +1282,7 @@ def delete_cookie_file(cookie_file: str) -> None:
     absolute = _cookie_absolute_path(cookie_file)
     if not absolute:
         return
+    _VERIFIED_COOKIE_PATHS.pop(absolute, None)
     try:
         if os.path.exists(absolute):
             os.remove(absolute)
@@ -708,44 +1298,126 @@ def ensure_configured() -> Optional[object]:
         return None
     if request.endpoint is None:
         return None
-    if is_configured():
+    if _CACHE.get("configured") or is_configured():
         return None
     return redirect(url_for("setup"))
 
 
 def get_all_movies() -> List[Dict]:
     """Fetch all movies from Radarr and cache the results."""
-    cached_movies = _CACHE.get("movies")
-    if isinstance(cached_movies, list):
-        return cached_movies
+    cached = _CACHE.get("movies")
+    if isinstance(cached, dict) and time.monotonic() < cached["expires"]:
+        return cached["data"]
 
     config = load_config()
     if not is_configured(config):
         return []
 
     try:
-        movies = _fetch_radarr_movies(config)
-        _CACHE["movies"] = movies
-        return movies
+        return _refresh_movie_cache(config)
     except (requests.RequestException, ValueError) as exc:  # pragma: no cover - network errors
         print(f"Error fetching movies from Radarr: {exc}")
+        if isinstance(cached, dict):
+            return cached["data"]
         return []
 
 
-def _fetch_radarr_movies(config: Dict) -> List[Dict]:
-    """Return the full list of movies from Radarr sorted alphabetically."""
+def _refresh_movie_cache(config: Dict) -> List[Dict]:
+    """Revalidate the cached movie list against Radarr and return it."""
+
+    cached = _CACHE.get("movies")
+    validators: Dict[str, str] = {}
+    if isinstance(cached, dict):
+        validators = cached["validators"]
 
-    response = requests.get(
+    movies, fresh_validators = _fetch_radarr_movies(config, validators)
+    if movies is None:
+        if not isinstance(cached, dict):
+            raise ValueError("Radarr returned an invalid movie list.")
+        movies = cached["data"]
+        fresh_validators = fresh_validators or validators
+        by_tmdb, by_title, by_id = cached["by_tmdb"], cached["by_title"], cached["by_id"]
+    else:
+        by_tmdb, by_title, by_id = _index_movies(movies)
+    _CACHE["movies"] = {
+        "data": movies,
+        "validators": fresh_validators,
+        "expires": time.monotonic() + MOVIES_CACHE_TTL,
+        "by_tmdb": by_tmdb,
+        "by_title": by_title,
+        "by_id": by_id,
+    }
+    return movies
+
+
+def _index_movies(
+    movies: List[Dict],
+) -> Tuple[Dict[str, Dict], Dict[str, List[Dict]], Dict[str, Dict]]:
+    """Return TMDb, lower-cased title and Radarr ID lookups for a movie list."""
+
+    by_tmdb: Dict[str, Dict] = {}
+    by_title: Dict[str, List[Dict]] = {}
+    by_id: Dict[str, Dict] = {}
+    for movie in movies:
+        tmdb_id = str(movie.get("tmdbId") or "")
+        if tmdb_id:
+            by_tmdb.setdefault(tmdb_id, movie)
+        by_title.setdefault(str(movie.get("title") or "").lower(), []).append(movie)
+        movie_id = movie.get("id")
+        if movie_id is not None:
+            by_id[str(movie_id)] = movie
+    return by_tmdb, by_title, by_id
+
+
+def _get_movie_index() -> Tuple[Dict[str, Dict], Dict[str, List[Dict]]]:
+    """Return the lookup indices for the current Radarr movie list."""
+
+    movies = get_all_movies()
+    cached = _CACHE.get("movies")
+    if isinstance(cached, dict) and cached["data"] is movies:
+        return cached["by_tmdb"], cached["by_title"]
+    by_tmdb, by_title, _ = _index_movies(movies)
+    return by_tmdb, by_title
+
+
+def _fetch_radarr_movies(
+    config: Dict, validators: Optional[Dict[str, str]] = None
+) -> Tuple[Optional[List[Dict]], Dict[str, str]]:
+    """Return the full list of movies from Radarr sorted alphabetically.
+
+    ``validators`` holds the ``ETag``/``Last-Modified`` values from a previous
+    response. When Radarr reports the list as unchanged the movie list is
+    returned as ``None`` so callers can reuse their cached copy.
+    """
+
+    headers = {"X-Api-Key": config["radarr_api_key"]}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = _HTTP_SESSION.get(
         f"{config['radarr_url']}/api/v3/movie",
-        headers={"X-Api-Key": config["radarr_api_key"]},
-        timeout=10,
+        headers=headers,
+        timeout=RADARR_TIMEOUT,
     )
+    fresh_validators = {
+        key: value
+        for key, value in (
+            ("etag", response.headers.get("ETag")),
+            ("last_modified", response.headers.get("Last-Modified")),
+        )
+        if value
+    }
+    if response.status_code == 304:
+        return None, fresh_validators
     response.raise_for_status()
     movies = response.json()
     if not isinstance(movies, list):
         raise ValueError("Radarr returned an invalid movie list.")
     movies.sort(key=lambda movie: str(movie.get("title", "")).lower())
-    return movies
+    return movies, fresh_validators
 
 
 def _radarr_headers(config: Dict) -> Dict[str, str]:
@@ -773,18 +1445,54 @@ def _radarr_request(
     if payload is not None:
         headers["Content-Type"] = "application/json"
 
-    response = requests.request(
+    response = _HTTP_SESSION.request(
         method.upper(),
         url,
         headers=headers,
         params=params,
         json=payload,
-        timeout=10,
+        timeout=RADARR_TIMEOUT,
     )
     response.raise_for_status()
     return response
 
 
+def _get_radarr_movie(movie_id: str, config: Dict) -> Dict:
+    """Return Radarr's details for a movie, reusing a recent response.
+
+    The cached library list holds the same movie resources, so a fresh copy
+    answers most lookups without a request. Otherwise back-to-back jobs for
+    the same movie (a trailer and a featurette, say) are served from memory
+    for ``MOVIE_DETAIL_CACHE_TTL`` seconds.
+    """
+
+    library = _CACHE.get("movies")
+    if isinstance(library, dict) and time.monotonic() < library["expires"]:
+        listed = library["by_id"].get(movie_id)
+        if listed is not None:
+            return listed
+
+    cache_key = (str(config.get("radarr_url") or ""), movie_id)
+    with _MOVIE_DETAIL_CACHE_LOCK:
+        cached = _MOVIE_DETAIL_CACHE.get(cache_key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < MOVIE_DETAIL_CACHE_TTL:
+                _MOVIE_DETAIL_CACHE.move_to_end(cache_key)
+                return cached[1]
+            _MOVIE_DETAIL_CACHE.pop(cache_key, None)
+
+    movie = _radarr_request("GET", f"/api/v3/movie/{movie_id}", config=config).json()
+    if not isinstance(movie, dict):
+        raise ValueError("Radarr returned an invalid movie.")
+
+    with _MOVIE_DETAIL_CACHE_LOCK:
+        _MOVIE_DETAIL_CACHE[cache_key] = (time.monotonic(), movie)
+        _MOVIE_DETAIL_CACHE.move_to_end(cache_key)
+        while len(_MOVIE_DETAIL_CACHE) > MOVIE_DETAIL_CACHE_MAX_ITEMS:
+            _MOVIE_DETAIL_CACHE.popitem(last=False)
+    return movie
+
+
 def _lookup_tmdb_movie(tmdb_id: str, config: Dict) -> Optional[Dict]:
     """Return Radarr lookup data for a TMDb identifier."""
 
@@ -813,8 +1521,11 @@ def _lookup_tmdb_movie(tmdb_id: str, config: Dict) -> Optional[Dict]:
 def _load_radarr_library_options(config: Dict) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """Fetch Radarr root folders and quality profiles."""
 
-    root_response = _radarr_request("GET", "/api/v3/rootFolder", config=config)
+    root_future = _RADARR_POOL.submit(
+        _radarr_request, "GET", "/api/v3/rootFolder", config=config
+    )
     quality_response = _radarr_request("GET", "/api/v3/qualityProfile", config=config)
+    root_response = root_future.result()
 
     try:
         root_payload = root_response.json()
@@ -845,7 +1556,7 @@ def _select_default_root_path(root_folders: List[Dict[str, Any]]) -> Optional[st
     for entry in root_folders or []:
         if not isinstance(entry, dict):
             continue
-        path = str(entry.get("path") or "").strip()
+        path = _clean_text(entry.get("path"))
         if not path:
             continue
         candidates.append({"path": path, "accessible": bool(entry.get("accessible", True))})
@@ -875,9 +1586,10 @@ def _select_default_quality_profile_id(quality_profiles: List[Dict[str, Any]]) -
     return None
 
 
+@lru_cache(maxsize=1024)
 def sanitize_filename(name: str) -> str:
     """Sanitize a string to be safe as a filename."""
-    sanitized = re.sub(r'[\\/:*?"<>|]+', "_", name)
+    sanitized = _UNSAFE_FILENAME_RE.sub("_", name)
     return sanitized.strip().rstrip('.')
 
 
@@ -885,8 +1597,8 @@ def build_movie_stem(movie: Dict) -> str:
     """Return the canonical movie stem ``Title (Year) {tmdb-ID}``."""
 
     title = str(movie.get("title") or "Movie").strip()
-    year = str(movie.get("year") or "").strip()
-    tmdb_id = str(movie.get("tmdbId") or "").strip()
+    year = _clean_text(movie.get("year"))
+    tmdb_id = _clean_text(movie.get("tmdbId"))
 
     parts = [title]
     if year:
@@ -910,15 +1622,14 @@ def resolve_movie_by_metadata(
     if movie_id:
         return {"id": str(movie_id)}
 
-    movies = get_all_movies()
+    by_tmdb, by_title = _get_movie_index()
     if tmdb:
-        for movie in movies:
-            if str(movie.get("tmdbId") or "") == tmdb:
-                log(f"Matched TMDb ID {tmdb} to Radarr movie '{movie.get('title')}'.")
-                return movie
+        movie = by_tmdb.get(tmdb)
+        if movie is not None:
+            log(f"Matched TMDb ID {tmdb} to Radarr movie '{movie.get('title')}'.")
+            return movie
     if title:
-        lowered = title.lower()
-        matches = [movie for movie in movies if movie.get("title", "").lower() == lowered]
+        matches = by_title.get(title.lower(), [])
         if year:
             matches = [movie for movie in matches if str(movie.get("year") or "") == year]
         if matches:
@@ -935,38 +1646,60 @@ def resolve_movie_by_metadata(
     return None
 
 
-EXTRA_TYPE_LABELS = {
-    "trailer": "Trailer",
-    "behindthescenes": "Behind the Scenes",
-    "deleted": "Deleted Scene",
-    "featurette": "Featurette",
-    "interview": "Interview",
-    "scene": "Scene",
-    "short": "Short",
-    "other": "Other",
-}
+EXTRA_TYPE_LABELS: Mapping[str, str] = MappingProxyType(
+    {
+        "trailer": "Trailer",
+        "behindthescenes": "Behind the Scenes",
+        "deleted": "Deleted Scene",
+        "featurette": "Featurette",
+        "interview": "Interview",
+        "scene": "Scene",
+        "short": "Short",
+        "other": "Other",
+    }
+)
 
 
-EXTRA_TYPE_ALIASES = {
-    "trailers": "trailer",
-    "behindthescene": "behindthescenes",
-    "behindthescenesclip": "behindthescenes",
-    "behindthescenesfeature": "behindthescenes",
-    "behindthescenesfeaturette": "behindthescenes",
-    "deletedscene": "deleted",
-    "deletedscenes": "deleted",
-    "featurettes": "featurette",
-    "interviews": "interview",
-    "scenes": "scene",
-    "shorts": "short",
-    "extras": "other",
-}
+EXTRA_TYPE_ALIASES: Mapping[str, str] = MappingProxyType(
+    {
+        "trailers": "trailer",
+        "behindthescene": "behindthescenes",
+        "behindthescenesclip": "behindthescenes",
+        "behindthescenesfeature": "behindthescenes",
+        "behindthescenesfeaturette": "behindthescenes",
+        "deletedscene": "deleted",
+        "deletedscenes": "deleted",
+        "featurettes": "featurette",
+        "interviews": "interview",
+        "scenes": "scene",
+        "shorts": "short",
+        "extras": "other",
+    }
+)
+
+
+ALLOWED_EXTRA_TYPES = frozenset(EXTRA_TYPE_LABELS)
+
+
+# Subfolder names Plex/Jellyfin recognise for each extra type.
+EXTRA_TYPE_FOLDERS: Mapping[str, str] = MappingProxyType(
+    {
+        "trailer": "Trailers",
+        "behindthescenes": "Behind The Scenes",
+        "deleted": "Deleted Scenes",
+        "featurette": "Featurettes",
+        "interview": "Interviews",
+        "scene": "Scenes",
+        "short": "Shorts",
+        "other": "Other",
+    }
+)
 
 
 def normalize_extra_type_key(raw_value: str) -> Optional[str]:
     """Return a canonical extra type key for a user-provided value."""
 
-    token = re.sub(r"[^a-z]", "", str(raw_value or "").lower())
+    token = _EXTRA_TYPE_STRIP_RE.sub("", str(raw_value or "").lower())
     if not token:
         return None
     if token in EXTRA_TYPE_LABELS:
@@ -974,39 +1707,49 @@ def normalize_extra_type_key(raw_value: str) -> Optional[str]:
     return EXTRA_TYPE_ALIASES.get(token)
 
 
+def _clean_text(value: Any, default: str = "") -> str:
+    """Return a payload value as a stripped string, or ``default`` when empty."""
+
+    if not value:
+        return default
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip()
+
+
 def _describe_job(payload: Dict) -> Dict:
     """Build presentation metadata for a job payload."""
-    movie_label = (payload.get("movieName") or payload.get("title") or "").strip()
+    movie_label = _clean_text(payload.get("movieName") or payload.get("title"))
     standalone = bool(payload.get("standalone"))
-    standalone_name_mode = (payload.get("standalone_name_mode") or "youtube").strip().lower()
-    standalone_custom_name = (payload.get("standalone_custom_name") or "").strip()
+    standalone_name_mode = _clean_text(payload.get("standalone_name_mode"), "youtube").lower()
+    standalone_custom_name = _clean_text(payload.get("standalone_custom_name"))
     if standalone and standalone_name_mode == "custom" and standalone_custom_name:
         movie_label = standalone_custom_name
     if not movie_label:
         movie_label = "Standalone Download" if standalone else "Selected Movie"
     if standalone and movie_label == "Standalone Download":
-        override_title = (payload.get("title") or "").strip()
+        override_title = _clean_text(payload.get("title"))
         if override_title:
             movie_label = override_title
     if not standalone and movie_label == "Standalone Download":
         movie_label = "Selected Movie"
     extra = bool(payload.get("extra"))
-    extra_type = (payload.get("extraType") or "trailer").strip().lower()
-    extra_name = (payload.get("extra_name") or "").strip()
     merge_playlist = bool(payload.get("merge_playlist"))
-    playlist_mode = (
-        payload.get("playlist_mode")
-        or ("merge" if merge_playlist else "single")
-    ).strip().lower()
+    playlist_mode = _clean_text(
+        payload.get("playlist_mode"), "merge" if merge_playlist else "single"
+    ).lower()
     if playlist_mode == "merge":
         merge_playlist = True
-    extra_label = extra_name or EXTRA_TYPE_LABELS.get(extra_type, extra_type.capitalize())
-    if extra and extra_label:
-        label = f"{movie_label} – {extra_label}"
-        subtitle = f"Extra • {extra_label}"
-    else:
-        label = movie_label
-        subtitle = ""
+    label = movie_label
+    subtitle = ""
+    if extra:
+        extra_label = _clean_text(payload.get("extra_name"))
+        if not extra_label:
+            extra_type = _clean_text(payload.get("extraType"), "trailer").lower()
+            extra_label = EXTRA_TYPE_LABELS.get(extra_type) or extra_type.capitalize()
+        if extra_label:
+            label = f"{movie_label} – {extra_label}"
+            subtitle = f"Extra • {extra_label}"
     metadata = []
     if extra:
         metadata.append("Stored as extra content")
@@ -1017,16 +1760,18 @@ def _describe_job(payload: Dict) -> Dict:
     return {"label": label or "Radarr Download", "subtitle": subtitle, "metadata": metadata}
 
 
-ALLOWED_PLAYLIST_MODES = {"single", "merge"}
+ALLOWED_PLAYLIST_MODES = frozenset({"single", "merge"})
+# Optional movie hints copied from the create request as stripped text.
+_CREATE_TEXT_FIELDS = ("movieName", "title", "year", "tmdb")
 
 
 def _validate_request_urls(data: Dict, error: Callable[[str], None]) -> str:
     """Return the validated YouTube URL from the request payload."""
 
-    yt_url = (data.get("yturl") or "").strip()
+    yt_url = _clean_text(data.get("yturl"))
     if not yt_url:
         error("YouTube URL is required.")
-    elif not re.search(r"(youtube\.com|youtu\.be)/", yt_url):
+    elif not _YOUTUBE_URL_RE.search(yt_url):
         error("Please provide a valid YouTube URL.")
     return yt_url
 
@@ -1034,7 +1779,7 @@ def _validate_request_urls(data: Dict, error: Callable[[str], None]) -> str:
 def _validate_movie_selection(data: Dict, error: Callable[[str], None]) -> str:
     """Ensure a movie has been chosen from the suggestions list."""
 
-    movie_id = (data.get("movieId") or "").strip()
+    movie_id = _clean_text(data.get("movieId"))
     if not movie_id:
         error("No movie selected. Please choose a movie from the suggestions list.")
     return movie_id
@@ -1043,7 +1788,7 @@ def _validate_movie_selection(data: Dict, error: Callable[[str], None]) -> str:
 def _resolve_playlist_mode(data: Dict, error: Callable[[str], None]) -> str:
     """Return the requested playlist handling mode."""
 
-    playlist_mode = (data.get("playlist_mode") or "single").strip().lower()
+    playlist_mode = _clean_text(data.get("playlist_mode"), "single").lower()
     if playlist_mode not in ALLOWED_PLAYLIST_MODES:
         error("Invalid playlist handling option selected.")
         playlist_mode = "single"
@@ -1056,12 +1801,12 @@ def _resolve_extra_settings(
     """Determine the extra storage options for the request."""
 
     extra_requested = bool(data.get("extra"))
-    extra_name = (data.get("extra_name") or "").strip()
+    extra_name = _clean_text(data.get("extra_name"))
 
     if extra_requested and not extra_name:
         error("Extra name is required when storing in a subfolder.")
 
-    selected_extra_type = (data.get("extraType") or "trailer").strip().lower()
+    selected_extra_type = _clean_text(data.get("extraType"), "trailer").lower()
 
     return extra_requested, extra_name, selected_extra_type
 
@@ -1083,17 +1828,14 @@ def _prepare_create_payload(data: Dict, error: Callable[[str], None]) -> Dict:
         selected_extra_type = "other"
 
     if standalone:
-        movie_id = (data.get("movieId") or "").strip()
+        movie_id = _clean_text(data.get("movieId"))
     else:
         movie_id = _validate_movie_selection(data, error)
 
     return {
         "yturl": _validate_request_urls(data, error),
         "movieId": movie_id,
-        "movieName": (data.get("movieName") or "").strip(),
-        "title": (data.get("title") or "").strip(),
-        "year": (data.get("year") or "").strip(),
-        "tmdb": (data.get("tmdb") or "").strip(),
+        **{key: _clean_text(data.get(key)) for key in _CREATE_TEXT_FIELDS},
         "extra": extra_requested,
         "extraType": selected_extra_type,
         "extra_name": extra_name,
@@ -1106,7 +1848,7 @@ def _prepare_create_payload(data: Dict, error: Callable[[str], None]) -> Dict:
 def _format_root_folder(entry: Dict[str, Any]) -> Dict[str, Any]:
     """Normalise a Radarr root folder entry for the UI."""
 
-    path = str(entry.get("path") or "").strip()
+    path = _clean_text(entry.get("path"))
     return {
         "id": entry.get("id"),
         "name": entry.get("name") or path or "Root Folder",
@@ -1252,7 +1994,7 @@ def _raise_radarr_http_error(exc: requests.HTTPError, default: str) -> None:
 def _parse_tmdb_id(data: Dict[str, Any]) -> str:
     """Extract and validate the TMDb identifier from the request payload."""
 
-    tmdb_id = str(data.get("tmdbId") or "").strip()
+    tmdb_id = _clean_text(data.get("tmdbId"))
     if not tmdb_id or not tmdb_id.isdigit():
         message = "TMDb ID is required." if not tmdb_id else "TMDb ID must be numeric."
         raise RadarrRequestError(message, 400)
@@ -1264,7 +2006,7 @@ def _resolve_library_selection(
 ) -> Tuple[str, int, bool, bool]:
     """Resolve root folder, quality profile, monitoring, and search defaults."""
 
-    root_folder_path = str(data.get("rootFolderPath") or "").strip()
+    root_folder_path = _clean_text(data.get("rootFolderPath"))
     quality_profile_id = _extract_quality_profile_id(data.get("qualityProfileId"))
     monitored = bool(data.get("monitored", True))
     search_flag = data.get("search")
@@ -1496,8 +2238,7 @@ def radarr_refresh_movies() -> Response:
         return _json_error(exc.message, exc.status)
 
     try:
-        movies = _fetch_radarr_movies(config)
-        _CACHE["movies"] = movies
+        movies = _refresh_movie_cache(config)
     except (requests.RequestException, ValueError) as exc:  # pragma: no cover - network errors
         print(f"Error refreshing movies from Radarr: {exc}")
         return _json_error("Failed to refresh Radarr movies.", 502)
@@ -1559,12 +2300,23 @@ def index():
     """Render the main application interface."""
     movies = get_all_movies()
     config = load_config()
-    return render_template(
+    configured = is_configured(config)
+    debug_mode = config.get("debug_mode", False)
+    # The page only changes with the movie list, the settings and the mount
+    # point that url_for renders against, so reuse the last rendering.
+    page_key = (configured, debug_mode, request.script_root)
+    cached = _CACHE.get("index_page")
+    if cached is not None and cached[0] is movies and cached[1] == page_key:
+        return cached[2]
+
+    page = render_template(
         "index.html",
         movies=movies,
-        configured=is_configured(config),
-        debug_mode=config.get("debug_mode", False),
+        configured=configured,
+        debug_mode=debug_mode,
     )
+    _CACHE["index_page"] = (movies, page_key, page)
+    return page
 
 
 @app.route("/create", methods=["POST"])
@@ -1588,7 +2340,7 @@ def create():
         return jsonify({"logs": logs}), 400
 
     descriptors = _describe_job(payload)
-    job_id = str(uuid.uuid4())
+    job_id = _new_job_id()
     job_record = jobs_repo.create(
         {
             "id": job_id,
@@ -1604,13 +2356,9 @@ def create():
     )
 
     cancel_event = threading.Event()
-    worker = threading.Thread(
-        target=process_download_job,
-        args=(job_id, payload, cancel_event),
-        daemon=True,
-    )
-    _register_job_control(job_id, worker, cancel_event)
-    worker.start()
+    _register_job_control(job_id, cancel_event)
+    future = _JOB_POOL.submit(process_download_job, job_id, payload, cancel_event)
+    _set_job_future(job_id, future)
 
     display_job = dict(job_record)
     display_job["logs"] = _filter_logs_for_display(
@@ -1620,6 +2368,234 @@ def create():
     return jsonify({"job": display_job, "debug_mode": config.get("debug_mode", False)}), 202
 
 
+def _run_metadata_query(
+    job_id: str,
+    command: List[str],
+    cancel_event: threading.Event,
+    abort_event: threading.Event,
+    warn: Callable[[str], None],
+) -> Tuple[bytes, str, Optional[int], bool]:
+    """Run the yt-dlp metadata query for a job and collect its output.
+
+    Returns ``(stdout, stderr, returncode, timed_out)``. yt-dlp prints one JSON
+    line per video, so the query is stopped as soon as the first complete video
+    entry has arrived instead of waiting for a whole playlist to resolve; for
+    a playlist, that first entry is the one the job reports. The query is
+    stopped quietly when ``abort_event`` is set and raises
+    :class:`JobCancelled` when the job is cancelled while it runs.
+    """
+    # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+
+    stdout_data = b""
+    stderr_text = ""
+    returncode: Optional[int] = None
+    timed_out = False
+    entry_ready = False
+    scanned_upto = 0
+
+    try:
+        with subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+            text=False,
+        ) as info_process:
+            _set_job_process(job_id, info_process)
+            start_time = time.monotonic()
+
+            selector = selectors.DefaultSelector()
+            stdout_chunks: List[bytes] = []
+            stderr_chunks: List[bytes] = []
+
+            if info_process.stdout is not None:
+                selector.register(info_process.stdout, selectors.EVENT_READ, "stdout")
+            if info_process.stderr is not None:
+                selector.register(info_process.stderr, selectors.EVENT_READ, "stderr")
+
+            def _drain_events(timeout: float) -> bool:
+                """Read pending output; return whether a new stdout line ended."""
+
+                line_ended = False
+                try:
+                    events = selector.select(timeout=timeout)
+                except OSError:
+                    events = []
+                for key, _ in events:
+                    stream = key.fileobj
+                    label = key.data
+                    try:
+                        chunk = stream.read1(4096)
+                    except (ValueError, OSError):
+                        chunk = b""
+                    if not chunk:
+                        try:
+                            selector.unregister(stream)
+                        except (KeyError, ValueError):
+                            pass
+                        try:
+                            stream.close()
+                        except OSError:
+                            pass
+                        continue
+                    if label == "stdout":
+                        stdout_chunks.append(chunk)
+                        line_ended = line_ended or b"\n" in chunk
+                    else:
+                        stderr_chunks.append(chunk)
+                return line_ended
+
+            try:
+                while True:
+                    if cancel_event.is_set():
+                        _terminate_process(info_process)
+                        raise JobCancelled()
+                    if abort_event.is_set():
+                        _terminate_process(info_process)
+                        break
+
+                    if METADATA_FETCH_TIMEOUT_SECONDS:
+                        elapsed = time.monotonic() - start_time
+                        if elapsed >= METADATA_FETCH_TIMEOUT_SECONDS:
+                            timed_out = True
+                            warn(
+                                "yt-dlp metadata query exceeded "
+                                f"{METADATA_FETCH_TIMEOUT_SECONDS} seconds; "
+                                "continuing without metadata."
+                            )
+                            _terminate_process(info_process)
+                            break
+
+                    if _drain_events(timeout=0.2):
+                        # Only lines completed since the last check are parsed.
+                        buffered = b"".join(stdout_chunks)
+                        stdout_chunks[:] = [buffered]
+                        line_end = buffered.rfind(b"\n") + 1
+                        if _has_video_entry(buffered[scanned_upto:line_end]):
+                            entry_ready = True
+                            _terminate_process(info_process)
+                            break
+                        scanned_upto = line_end
+
+                    if not selector.get_map():
+                        if info_process.poll() is not None:
+                            break
+                        try:
+                            info_process.wait(timeout=0.2)
+                        except subprocess.TimeoutExpired:
+                            continue
+                        else:
+                            break
+
+                    if info_process.poll() is not None:
+                        # Process has exited but there may still be buffered data.
+                        _drain_events(timeout=0)
+                        if not selector.get_map():
+                            break
+            finally:
+                # Drain any remaining buffered data without blocking.
+                try:
+                    _drain_events(timeout=0)
+                except (OSError, ValueError, RuntimeError):
+                    # pragma: no cover - defensive cleanup
+                    pass
+                selector.close()
+
+            try:
+                returncode = info_process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                _terminate_process(info_process)
+                try:
+                    returncode = info_process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    returncode = info_process.returncode
+            except OSError:
+                returncode = info_process.returncode
+
+            stdout_data = b"".join(stdout_chunks)
+            stderr_text = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+            if entry_ready:
+                # yt-dlp was stopped on purpose; keep only the complete lines.
+                stdout_data = stdout_data[: stdout_data.rfind(b"\n") + 1]
+                returncode = 0
+    except (
+        FileNotFoundError,
+        OSError,
+        ValueError,
+    ) as exc:  # pragma: no cover - command failure
+        warn(f"Failed to query format details via yt-dlp: {exc}")
+    finally:
+        _clear_job_process(job_id)
+
+    return stdout_data, stderr_text, returncode, timed_out
+
+
+def _metadata_cache_key(command: List[str], cookie_path: str) -> Tuple[Any, ...]:
+    """Return the cache key for a metadata query, including the cookie mtime."""
+
+    cookie_mtime = 0
+    if cookie_path:
+        try:
+            cookie_mtime = os.stat(cookie_path).st_mtime_ns
+        except OSError:
+            cookie_mtime = 0
+    return (tuple(command), cookie_mtime)
+
+
+def _get_cached_metadata(
+    cache_key: Tuple[Any, ...], now: float
+) -> Optional[Tuple[bytes, str]]:
+    """Return cached metadata query output if it is still fresh."""
+
+    with _METADATA_CACHE_LOCK:
+        cached = _METADATA_CACHE.get(cache_key)
+        if cached is None:
+            return None
+        if now - cached[0] >= METADATA_CACHE_TTL:
+            _METADATA_CACHE.pop(cache_key, None)
+            return None
+        _METADATA_CACHE.move_to_end(cache_key)
+        return cached[1], cached[2]
+
+
+def _store_metadata(
+    cache_key: Tuple[Any, ...], now: float, stdout_data: bytes, stderr_text: str
+) -> None:
+    """Remember successful metadata query output, evicting the oldest entries."""
+
+    with _METADATA_CACHE_LOCK:
+        _METADATA_CACHE[cache_key] = (now, stdout_data, stderr_text)
+        _METADATA_CACHE.move_to_end(cache_key)
+        while len(_METADATA_CACHE) > METADATA_CACHE_MAX_ITEMS:
+            _METADATA_CACHE.popitem(last=False)
+
+
+def _query_youtube_metadata(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    job_id: str,
+    command: List[str],
+    cookie_path: str,
+    cancel_event: threading.Event,
+    abort_event: threading.Event,
+    warn: Callable[[str], None],
+) -> Tuple[bytes, str, Optional[int], bool, bool]:
+    """Return yt-dlp metadata output, reusing a recent result for the same query.
+
+    The result is ``(stdout, stderr, returncode, timed_out, cached)``, where
+    ``cached`` is true when the output came from an earlier job's query.
+    """
+
+    cache_key = _metadata_cache_key(command, cookie_path)
+    cached = _get_cached_metadata(cache_key, time.monotonic())
+    if cached is not None:
+        return cached[0], cached[1], 0, False, True
+
+    result = _run_metadata_query(job_id, command, cancel_event, abort_event, warn)
+    stdout_data, stderr_text, returncode, timed_out = result
+    if returncode == 0 and not timed_out and stdout_data.strip():
+        _store_metadata(cache_key, time.monotonic(), stdout_data, stderr_text)
+    return stdout_data, stderr_text, returncode, timed_out, False
+
+
 def process_download_job(
     job_id: str, payload: Dict, cancel_event: threading.Event
 ) -> None:
@@ -1640,8 +2616,10 @@ def process_download_job(
         append_job_log(job_id, f"DEBUG: {message}")
 
     cancellation_logged = False
+    metadata_abort = threading.Event()
     playlist_temp_dir: Optional[str] = None
-    expected_pattern: Optional[str] = None
+    expected_output: Optional[Tuple[str, str]] = None
+    info_json_path: Optional[str] = None
     downloaded_candidates: List[str] = []
     merge_playlist = False
 
@@ -1669,11 +2647,11 @@ def process_download_job(
         compact_progress_logs = not debug_enabled
         cookie_path = get_cookie_path(config)
 
-        yt_url = (payload.get("yturl") or "").strip()
-        movie_id = (payload.get("movieId") or "").strip()
-        tmdb = (payload.get("tmdb") or "").strip()
-        title = (payload.get("title") or "").strip()
-        year = (payload.get("year") or "").strip()
+        yt_url = _clean_text(payload.get("yturl"))
+        movie_id = _clean_text(payload.get("movieId"))
+        tmdb = _clean_text(payload.get("tmdb"))
+        title = _clean_text(payload.get("title"))
+        year = _clean_text(payload.get("year"))
         merge_playlist = bool(payload.get("merge_playlist"))
         playlist_mode = (
             payload.get("playlist_mode")
@@ -1694,7 +2672,7 @@ def process_download_job(
         ).strip().lower()
         if standalone_name_mode not in {"youtube", "custom"}:
             standalone_name_mode = "youtube"
-        standalone_custom_name = (payload.get("standalone_custom_name") or "").strip()
+        standalone_custom_name = _clean_text(payload.get("standalone_custom_name"))
         if not standalone:
             standalone_name_mode = "youtube"
             standalone_custom_name = ""
@@ -1705,17 +2683,7 @@ def process_download_job(
         payload["standalone_custom_name"] = standalone_custom_name
 
         extra_type = (payload.get("extraType") or "trailer").strip().lower()
-        allowed_extra_types = {
-            "trailer",
-            "behindthescenes",
-            "deleted",
-            "featurette",
-            "interview",
-            "scene",
-            "short",
-            "other",
-        }
-        if extra_type not in allowed_extra_types:
+        if extra_type not in ALLOWED_EXTRA_TYPES:
             log(f"Unknown extra type '{extra_type}', defaulting to 'other'.")
             extra_type = "other"
         payload["extraType"] = extra_type
@@ -1734,11 +2702,37 @@ def process_download_job(
         ensure_not_cancelled()
 
         extra = bool(payload.get("extra")) and not standalone
-        extra_name = (payload.get("extra_name") or "").strip() if extra else ""
+        extra_name = _clean_text(payload.get("extra_name")) if extra else ""
+        # Both the Radarr extra label and the download stem use this.
+        safe_extra_name = sanitize_filename(extra_name)
         payload["extra"] = extra
         payload["extra_name"] = extra_name
         jobs_repo.update(job_id, {"request": payload})
 
+        # The metadata query only depends on the URL, so run it while the
+        # Radarr movie details and folders are resolved below.
+        ytdlp_command = _find_executable("yt-dlp") or "yt-dlp"
+        cookie_args = ("--cookies", cookie_path) if cookie_path else ()
+        playlist_flag = "--yes-playlist" if merge_playlist else "--no-playlist"
+        info_command = [
+            ytdlp_command,
+            *cookie_args,
+            *_YTDLP_INFO_ARGS,
+            playlist_flag,
+            "--print-json",
+            yt_url,
+        ]
+        log("Fetching YouTube metadata to determine output naming and formats.")
+        metadata_query = _METADATA_POOL.submit(
+            _query_youtube_metadata,
+            job_id,
+            info_command,
+            cookie_path,
+            cancel_event,
+            metadata_abort,
+            warn,
+        )
+
         movie: Dict[str, Any] = {}
         target_dir = ""
         canonical_stem = ""
@@ -1765,13 +2759,7 @@ def process_download_job(
 
             try:
                 log(f"Fetching Radarr details for movie ID {movie_id}.")
-                response = requests.get(
-                    f"{config['radarr_url']}/api/v3/movie/{movie_id}",
-                    headers={"X-Api-Key": config["radarr_api_key"]},
-                    timeout=10,
-                )
-                response.raise_for_status()
-                movie = response.json()
+                movie = _get_radarr_movie(movie_id, config)
             except (requests.RequestException, ValueError) as exc:
                 # pragma: no cover - network errors
                 fail(f"Could not retrieve movie info from Radarr (ID {movie_id}): {exc}")
@@ -1793,22 +2781,14 @@ def process_download_job(
 
             ensure_not_cancelled()
 
-            folder_map = {
-                "trailer": "Trailers",
-                "behindthescenes": "Behind The Scenes",
-                "deleted": "Deleted Scenes",
-                "featurette": "Featurettes",
-                "interview": "Interviews",
-                "scene": "Scenes",
-                "short": "Shorts",
-                "other": "Other",
-            }
-
             target_dir = movie_path
             if extra:
-                subfolder = folder_map.get(extra_type, extra_type.capitalize() + "s")
+                subfolder = EXTRA_TYPE_FOLDERS.get(
+                    extra_type, extra_type.capitalize() + "s"
+                )
                 target_dir = os.path.join(movie_path, subfolder)
-                os.makedirs(target_dir, exist_ok=True)
+                if not os.path.isdir(target_dir):
+                    os.makedirs(target_dir, exist_ok=True)
                 log(f"Storing video in subfolder '{subfolder}'.")
             else:
                 log("Treating video as main video file.")
@@ -1818,7 +2798,7 @@ def process_download_job(
 
             canonical_stem = movie_stem
             if extra:
-                extra_label = sanitize_filename(extra_name) or EXTRA_TYPE_LABELS.get(
+                extra_label = safe_extra_name or EXTRA_TYPE_LABELS.get(
                     extra_type, extra_type.capitalize()
                 )
                 if extra_label:
@@ -1839,156 +2819,28 @@ def process_download_job(
 
         info_payload: Optional[Dict] = None
 
-        if shutil.which("ffmpeg") is None:
+        if _find_executable("ffmpeg") is None:
             warn(
                 "ffmpeg executable not found; yt-dlp may fall back to a lower quality "
                 "progressive stream."
             )
 
-        progress_pattern = re.compile(r"(\d{1,3}(?:\.\d+)?)%")
-        format_selector = YTDLP_FORMAT_SELECTOR
-
-        info_command = ["yt-dlp"]
-        if cookie_path:
-            info_command += ["--cookies", cookie_path]
-        info_command += [
-            "-f",
-            format_selector,
-            "--skip-download",
-        ]
-        if merge_playlist:
-            info_command.append("--yes-playlist")
-        else:
-            info_command.append("--no-playlist")
-        info_command += [
-            "--print-json",
-            yt_url,
-        ]
-
         resolved_format: Dict[str, str] = {}
         ensure_not_cancelled()
 
         info_payload = None
-        info_stdout = ""
-        info_stderr = ""
-        info_returncode: Optional[int] = None
-        metadata_timed_out = False
-
-        log("Fetching YouTube metadata to determine output naming and formats.")
 
         try:
-            with subprocess.Popen(
-                info_command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                stdin=subprocess.DEVNULL,
-                text=False,
-            ) as info_process:
-                _set_job_process(job_id, info_process)
-                start_time = time.monotonic()
-
-                selector = selectors.DefaultSelector()
-                stdout_chunks: List[bytes] = []
-                stderr_chunks: List[bytes] = []
-
-                if info_process.stdout is not None:
-                    selector.register(info_process.stdout, selectors.EVENT_READ, "stdout")
-                if info_process.stderr is not None:
-                    selector.register(info_process.stderr, selectors.EVENT_READ, "stderr")
-
-                def _drain_events(timeout: float) -> None:
-                    try:
-                        events = selector.select(timeout=timeout)
-                    except OSError:
-                        events = []
-                    for key, _ in events:
-                        stream = key.fileobj
-                        label = key.data
-                        try:
-                            chunk = stream.read1(4096)
-                        except (ValueError, OSError):
-                            chunk = b""
-                        if not chunk:
-                            try:
-                                selector.unregister(stream)
-                            except (KeyError, ValueError):
-                                pass
-                            try:
-                                stream.close()
-                            except OSError:
-                                pass
-                            continue
-                        if label == "stdout":
-                            stdout_chunks.append(chunk)
-                        else:
-                            stderr_chunks.append(chunk)
-
-                try:
-                    while True:
-                        if cancel_event.is_set():
-                            acknowledge_cancellation()
-                            _terminate_process(info_process)
-                            raise JobCancelled()
-
-                        if METADATA_FETCH_TIMEOUT_SECONDS:
-                            elapsed = time.monotonic() - start_time
-                            if elapsed >= METADATA_FETCH_TIMEOUT_SECONDS:
-                                metadata_timed_out = True
-                                warn(
-                                    "yt-dlp metadata query exceeded "
-                                    f"{METADATA_FETCH_TIMEOUT_SECONDS} seconds; "
-                                    "continuing without metadata."
-                                )
-                                _terminate_process(info_process)
-                                break
-
-                        _drain_events(timeout=0.2)
-
-                        if not selector.get_map():
-                            if info_process.poll() is not None:
-                                break
-                            try:
-                                info_process.wait(timeout=0.2)
-                            except subprocess.TimeoutExpired:
-                                continue
-                            else:
-                                break
-
-                        if info_process.poll() is not None:
-                            # Process has exited but there may still be buffered data.
-                            _drain_events(timeout=0)
-                            if not selector.get_map():
-                                break
-                finally:
-                    # Drain any remaining buffered data without blocking.
-                    try:
-                        _drain_events(timeout=0)
-                    except (OSError, ValueError, RuntimeError):
-                        # pragma: no cover - defensive cleanup
-                        pass
-                    selector.close()
-
-                try:
-                    info_returncode = info_process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    _terminate_process(info_process)
-                    try:
-                        info_returncode = info_process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        info_returncode = info_process.returncode
-                except OSError:
-                    info_returncode = info_process.returncode
-
-                info_stdout = b"".join(stdout_chunks).decode("utf-8", errors="replace")
-                info_stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
-        except (
-            FileNotFoundError,
-            OSError,
-            ValueError,
-        ) as exc:  # pragma: no cover - command failure
-            warn(f"Failed to query format details via yt-dlp: {exc}")
-        finally:
-            _clear_job_process(job_id)
+            (
+                info_stdout,
+                info_stderr,
+                info_returncode,
+                metadata_timed_out,
+                metadata_cached,
+            ) = metadata_query.result()
+        except JobCancelled:
+            acknowledge_cancellation()
+            raise
 
         if cancel_event.is_set():
             acknowledge_cancellation()
@@ -2000,36 +2852,20 @@ def process_download_job(
                 f"{info_returncode}; continuing without metadata."
             )
         else:
-            info_entries: List[Dict[str, Any]] = []
-            for raw_line in info_stdout.splitlines():
-                stripped = raw_line.strip()
-                if not stripped:
-                    continue
-                try:
-                    parsed_line = json.loads(stripped)
-                except json.JSONDecodeError:
-                    continue
-                if isinstance(parsed_line, dict):
-                    info_entries.append(parsed_line)
-
-            if not info_entries and info_stdout.strip():
-                try:
-                    parsed_blob = json.loads(info_stdout)
-                except json.JSONDecodeError:
-                    parsed_blob = None
-                if isinstance(parsed_blob, dict):
-                    info_entries.append(parsed_blob)
+            info_entries = _parse_metadata_entries(info_stdout)
 
+            # The query stops after the first video entry of a playlist, so
+            # that entry describes the job's title and format for every query.
             preferred_entry: Optional[Dict[str, Any]] = None
-            for candidate in reversed(info_entries):
+            for candidate in info_entries:
                 entry_type = str(candidate.get("_type") or "video").lower()
-                if entry_type in {"playlist", "multi_video", "multi"}:
+                if entry_type in _PLAYLIST_ENTRY_TYPES:
                     continue
                 preferred_entry = candidate
                 break
 
             if preferred_entry is None and info_entries:
-                preferred_entry = info_entries[-1]
+                preferred_entry = info_entries[0]
 
             info_payload = preferred_entry
 
@@ -2090,7 +2926,7 @@ def process_download_job(
         descriptive = sanitize_filename(descriptive) or default_label
 
         if extra:
-            extra_suffix = sanitize_filename(extra_name) or extra_type
+            extra_suffix = safe_extra_name or extra_type
             if extra_suffix:
                 filename_base = f"{descriptive}-{extra_suffix}"
             else:
@@ -2130,21 +2966,33 @@ def process_download_job(
                 standalone_base_path, standalone_folder_name
             )
             created_new = False
-            if os.path.isfile(final_folder_path):
+            # One stat answers both "is a file in the way" and "does it exist".
+            try:
+                folder_mode: Optional[int] = os.stat(final_folder_path).st_mode
+            except OSError:
+                folder_mode = None
+            folder_exists = folder_mode is not None and stat.S_ISDIR(folder_mode)
+            if folder_mode is not None and stat.S_ISREG(folder_mode):
+                # One listing tells which names are free or already folders.
+                try:
+                    with os.scandir(standalone_base_path) as entries:
+                        name_is_dir = {entry.name: entry.is_dir() for entry in entries}
+                except OSError:
+                    name_is_dir = {}
                 suffix = 1
                 base_name = standalone_folder_name
                 while True:
                     candidate_name = f"{base_name} ({suffix})"
-                    candidate_path = os.path.join(
-                        standalone_base_path, candidate_name
-                    )
-                    if not os.path.exists(candidate_path) or os.path.isdir(candidate_path):
-                        final_folder_path = candidate_path
+                    if name_is_dir.get(candidate_name, True):
+                        final_folder_path = os.path.join(
+                            standalone_base_path, candidate_name
+                        )
                         standalone_folder_name = candidate_name
+                        folder_exists = candidate_name in name_is_dir
                         break
                     suffix += 1
 
-            if not os.path.isdir(final_folder_path):
+            if not folder_exists:
                 try:
                     os.makedirs(final_folder_path, exist_ok=True)
                 except OSError as exc:
@@ -2168,8 +3016,8 @@ def process_download_job(
 
         download_filename_base = filename_base
 
-        pattern = os.path.join(download_dir, f"{download_filename_base}.*")
-        if any(os.path.exists(path) for path in glob_paths(pattern)):
+        taken_stems = _existing_stems(download_dir)
+        if download_filename_base in taken_stems:
             log(
                 f"File stem '{download_filename_base}' already exists. "
                 "Searching for a free filename."
@@ -2177,8 +3025,7 @@ def process_download_job(
             suffix_index = 1
             while True:
                 candidate_base = f"{download_filename_base} ({suffix_index})"
-                candidate_pattern = os.path.join(download_dir, f"{candidate_base}.*")
-                if not any(os.path.exists(path) for path in glob_paths(candidate_pattern)):
+                if candidate_base not in taken_stems:
                     download_filename_base = candidate_base
                     log(f"Selected new filename stem '{download_filename_base}'.")
                     break
@@ -2195,37 +3042,46 @@ def process_download_job(
             target_template = os.path.join(
                 playlist_temp_dir, "%(playlist_index)05d - %(title)s.%(ext)s"
             )
-            expected_pattern = os.path.join(playlist_temp_dir, "*.*")
+            expected_output = (playlist_temp_dir, "")
         else:
             target_template = os.path.join(download_dir, f"{template_base}.%(ext)s")
-            expected_pattern = os.path.join(download_dir, f"{download_filename_base}.*")
+            expected_output = (download_dir, download_filename_base)
+
+        command = [
+            ytdlp_command,
+            *cookie_args,
+            *_YTDLP_DOWNLOAD_ARGS,
+            playlist_flag,
+            "-o",
+            target_template,
+        ]
 
-        command = ["yt-dlp"]
-        if cookie_path:
-            command += ["--cookies", cookie_path]
-        command += ["--newline"]
-        command += ["-f", format_selector]
-        if merge_playlist:
-            command.append("--yes-playlist")
-        else:
-            command.append("--no-playlist")
-        command += ["-o", target_template, yt_url]
+        # A single video's metadata already holds everything yt-dlp needs, so
+        # hand it back instead of extracting the page a second time. Cached
+        # metadata is not reused: its signed stream URLs may have expired. The
+        # file lives in the temp directory so a crash cannot strand it in the
+        # library folder.
+        download_commands = [command + [yt_url]]
+        if info_payload and not merge_playlist and not metadata_cached:
+            try:
+                info_fd, info_json_path = tempfile.mkstemp(
+                    prefix=f"yt2radarr_info_{job_id}_", suffix=".json"
+                )
+                with os.fdopen(info_fd, "wb") as handle:
+                    handle.write(_json_dumps_bytes(info_payload))
+            except (OSError, TypeError, ValueError) as exc:
+                debug(f"Could not save metadata for reuse: {exc}")
+            else:
+                download_commands.insert(0, command + ["--load-info-json", info_json_path])
 
         log("Running yt-dlp with explicit output template.")
 
         _job_status(job_id, "processing", progress=20)
 
-        output_lines: List[str] = []
+        # Only the tail is needed to summarise a failure.
+        output_lines: "deque[str]" = deque(maxlen=8)
         progress_log_active = False
 
-        debug_prefixes = (
-            "[debug]",
-            "[info]",
-            "[extractor]",
-            "[metadata]",
-            "[youtube]",
-        )
-
         def handle_output_line(text: str) -> None:
             nonlocal progress_log_active
 
@@ -2233,7 +3089,8 @@ def process_download_job(
             if not line:
                 return
             output_lines.append(line)
-            match = progress_pattern.search(line)
+            # Most lines carry no percentage; skip the regex scan for those.
+            match = _PROGRESS_RE.search(line) if "%" in line else None
             if match:
                 try:
                     progress_value = float(match.group(1))
@@ -2251,93 +3108,118 @@ def process_download_job(
                     else:
                         append_job_log(job_id, line)
                     return
-            lowered = line.lower()
-            if "error" in lowered:
+            if _OUTPUT_ERROR_RE.search(line):
                 append_job_log(job_id, f"ERROR: {line}")
                 return
-            if "warning" in lowered:
+            if _OUTPUT_WARNING_RE.search(line):
                 warn(line)
                 return
-            if line.startswith("[download]") or line.startswith("[ffmpeg]"):
-                log(line)
-                return
-            if line.lower().startswith(debug_prefixes):
-                debug(line)
-                return
+            if line[:1] == "[" and not line.startswith(("[download]", "[ffmpeg]")):
+                if _OUTPUT_DEBUG_PREFIX_RE.match(line):
+                    debug(line)
+                    return
             log(line)
 
-        ensure_not_cancelled()
-
         return_code = 0
         try:
-            with subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                cwd=download_dir,
-                stdin=subprocess.DEVNULL,
-            ) as process:
-                _set_job_process(job_id, process)
-                assert process.stdout is not None
-                for raw_line in process.stdout:
-                    if cancel_event.is_set():
-                        acknowledge_cancellation()
-                        try:
-                            process.terminate()
-                        except OSError:
-                            pass
-                        try:
-                            process.wait(timeout=5)
-                        except subprocess.TimeoutExpired:
-                            try:
-                                process.kill()
-                            except OSError:
-                                pass
-                        _cleanup_temp_files(expected_pattern)
-                        raise JobCancelled()
-                    line = raw_line.rstrip()
-                    if not line:
-                        continue
-                    handle_output_line(line)
-                return_code = process.wait()
-        except (OSError, ValueError) as exc:  # pragma: no cover - command failure
-            fail(f"Failed to invoke yt-dlp: {exc}")
-            return
+            ensure_not_cancelled()
+            for attempt, download_command in enumerate(download_commands):
+                if attempt:
+                    ensure_not_cancelled()
+                    warn(
+                        "Download from the saved metadata failed; "
+                        "retrying with the video URL."
+                    )
+                    _cleanup_temp_files(expected_output)
+                    output_lines.clear()
+                    progress_log_active = False
+                try:
+                    with subprocess.Popen(
+                        download_command,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
+                        text=True,
+                        bufsize=SUBPROCESS_READ_BUFFER,
+                        cwd=download_dir,
+                        stdin=subprocess.DEVNULL,
+                    ) as process:
+                        _set_job_process(job_id, process)
+                        assert process.stdout is not None
+                        for raw_line in process.stdout:
+                            if cancel_event.is_set():
+                                acknowledge_cancellation()
+                                try:
+                                    process.terminate()
+                                except OSError:
+                                    pass
+                                try:
+                                    process.wait(timeout=5)
+                                except subprocess.TimeoutExpired:
+                                    try:
+                                        process.kill()
+                                    except OSError:
+                                        pass
+                                raise JobCancelled()
+                            line = raw_line.rstrip()
+                            if not line:
+                                continue
+                            handle_output_line(line)
+                        return_code = process.wait()
+                except (OSError, ValueError) as exc:  # pragma: no cover - command failure
+                    fail(f"Failed to invoke yt-dlp: {exc}")
+                    return
+                finally:
+                    _clear_job_process(job_id)
+                # Only retry from the URL when the saved metadata was the
+                # problem; other failures would just download everything twice.
+                if return_code == 0 or not any(
+                    _INFO_JSON_RETRY_RE.search(line) for line in output_lines
+                ):
+                    break
         finally:
-            _clear_job_process(job_id)
+            if info_json_path:
+                try:
+                    os.remove(info_json_path)
+                except OSError:
+                    pass
 
         if return_code != 0:
             failure_summary = output_lines[-1] if output_lines else "Download failed."
             log(f"yt-dlp exited with code {return_code}.")
 
-            _cleanup_temp_files(expected_pattern)
+            _cleanup_temp_files(expected_output)
 
             fail(f"Download failed: {failure_summary[:300]}")
             return
 
-        downloaded_candidates = [
-            path
-            for path in glob_paths(expected_pattern)
-            if os.path.isfile(path) and not path.endswith((".part", ".ytdl"))
-        ]
+        # Keep the directory entries: is_file() answers from the listing's
+        # file type, and DirEntry.stat() caches its result. On POSIX the first
+        # stat() is still a syscall per entry; only Windows returns it from
+        # the listing itself.
+        candidate_entries = {
+            entry.path: entry
+            for entry in _scan_download_outputs(expected_output)
+            if entry.is_file() and not entry.name.endswith((".part", ".ytdl"))
+        }
+        downloaded_candidates = list(candidate_entries)
 
-        if cancel_event.is_set():
-            acknowledge_cancellation()
-            for candidate in list(downloaded_candidates):
-                try:
-                    os.remove(candidate)
-                except OSError:
-                    continue
-            _cleanup_temp_files(expected_pattern)
-            raise JobCancelled()
+        # The JobCancelled handler removes the candidates and fragments.
+        ensure_not_cancelled()
 
         def _is_intermediate_file(name: str) -> bool:
             base = os.path.basename(name)
             if base.endswith(".temp") or ".temp." in base:
                 return True
-            return bool(re.search(r"\.f\d+\.\w+$", base))
+            # Unmerged streams are named ``stem.f<format id>.<ext>``.
+            parts = base.rsplit(".", 2)
+            if len(parts) != 3:
+                return False
+            format_part, extension = parts[1], parts[2]
+            return (
+                format_part[:1] == "f"
+                and format_part[1:].isdecimal()
+                and extension.replace("_", "").isalnum()
+            )
 
         if not downloaded_candidates:
             fail("Download completed but the output file could not be located.")
@@ -2347,27 +3229,29 @@ def process_download_job(
             if not playlist_temp_dir:
                 fail("Internal error: playlist staging directory was not created.")
                 return
-            ffmpeg_path = shutil.which("ffmpeg")
+            ffmpeg_path = _find_executable("ffmpeg")
             if ffmpeg_path is None:
                 fail("ffmpeg is required to merge playlist videos but was not found.")
                 return
-            downloaded_candidates.sort()
+            # Resolve every segment path once; the manifest and the cleanup
+            # below both need absolute paths.
+            downloaded_candidates = sorted(
+                os.path.abspath(candidate) for candidate in downloaded_candidates
+            )
             segment_count = len(downloaded_candidates)
             log(
                 f"Merging playlist videos with ffmpeg (segments: {segment_count})."
             )
 
-            def _escape_concat_path(value: str) -> str:
-                return value.replace("\\", "\\\\").replace("'", "\\'")
-
             concat_manifest = os.path.join(playlist_temp_dir, "concat.txt")
+            manifest_text = "".join(
+                f"file '{_escape_concat_path(candidate)}'\n"
+                for candidate in downloaded_candidates
+            )
             ensure_not_cancelled()
             try:
-                with open(concat_manifest, "w", encoding="utf-8") as handle:
-                    for candidate in downloaded_candidates:
-                        handle.write(
-                            f"file '{_escape_concat_path(os.path.abspath(candidate))}'\n"
-                        )
+                with open(concat_manifest, "wb") as handle:
+                    handle.write(manifest_text.encode("utf-8"))
             except OSError as exc:
                 fail(f"Failed to prepare playlist merge manifest: {exc}")
                 return
@@ -2377,6 +3261,10 @@ def process_download_job(
 
             merge_command = [
                 ffmpeg_path,
+                "-hide_banner",
+                "-nostats",
+                "-loglevel",
+                "warning",
                 "-y",
                 "-f",
                 "concat",
@@ -2391,34 +3279,31 @@ def process_download_job(
 
             ensure_not_cancelled()
 
-            stdout_data = ""
-            stderr_data = ""
             merge_returncode = 0
             try:
                 with subprocess.Popen(
                     merge_command,
-                    stdout=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
                     stderr=subprocess.PIPE,
                     text=True,
+                    errors="replace",
                     stdin=subprocess.DEVNULL,
                 ) as merge_process:
                     _set_job_process(job_id, merge_process)
                     try:
-                        stdout_data, stderr_data = merge_process.communicate()
+                        assert merge_process.stderr is not None
+                        # Stream diagnostics instead of buffering ffmpeg's output.
+                        for raw_line in merge_process.stderr:
+                            line = raw_line.strip()
+                            if line:
+                                debug(f"ffmpeg: {line}")
+                        merge_returncode = merge_process.wait()
                     finally:
                         _clear_job_process(job_id)
-                    merge_returncode = merge_process.returncode
             except (OSError, ValueError) as exc:
                 fail(f"Failed to invoke ffmpeg for playlist merge: {exc}")
                 return
 
-            if stdout_data:
-                for line in stdout_data.strip().splitlines():
-                    debug(f"ffmpeg: {line}")
-            if stderr_data:
-                for line in stderr_data.strip().splitlines():
-                    debug(f"ffmpeg: {line}")
-
             if cancel_event.is_set():
                 acknowledge_cancellation()
                 if os.path.exists(merged_output_path):
@@ -2439,8 +3324,9 @@ def process_download_job(
             except OSError:
                 pass
 
+            merged_abs = os.path.abspath(merged_output_path)
             for candidate in downloaded_candidates:
-                if os.path.abspath(candidate) == os.path.abspath(merged_output_path):
+                if candidate == merged_abs:
                     continue
                 try:
                     os.remove(candidate)
@@ -2459,51 +3345,43 @@ def process_download_job(
                 raise JobCancelled()
 
 
-        final_candidates = [
-            path for path in downloaded_candidates if not _is_intermediate_file(path)
-        ]
+        def _modified_ns(path: str) -> int:
+            entry = candidate_entries.get(path)
+            return (entry.stat() if entry is not None else os.stat(path)).st_mtime_ns
 
-        if final_candidates:
-            target_path = max(final_candidates, key=os.path.getmtime)
-        else:
-            downloaded_candidates.sort(key=os.path.getmtime, reverse=True)
-            target_path = downloaded_candidates[0]
+        final_candidates: List[str] = []
+        intermediate_files: List[str] = []
+        for path in downloaded_candidates:
+            if _is_intermediate_file(path):
+                intermediate_files.append(path)
+            else:
+                final_candidates.append(path)
+
+        # Prefer the newest finished file; fall back to the newest fragment.
+        target_path = selected_path = max(
+            final_candidates or intermediate_files, key=_modified_ns
+        )
         actual_extension = os.path.splitext(target_path)[1].lstrip(".").lower()
 
         job_snapshot = jobs_repo.get(job_id)
         if job_snapshot:
-            metadata = list(job_snapshot.get("metadata") or [])
-            updated_metadata: List[str] = []
-            def _should_keep(entry: object) -> bool:
-                if not isinstance(entry, str):
-                    return True
-                lowered = entry.lower()
-                prefixes = [
-                    "format:",
-                    "format id:",
-                    "resolution:",
-                    "video codec:",
-                    "audio codec:",
-                    "filesize:",
-                ]
-                return not any(lowered.startswith(prefix) for prefix in prefixes)
-
-            for item in metadata:
-                if _should_keep(item):
-                    updated_metadata.append(item)
-
-            if actual_extension:
-                updated_metadata.append(f"Format: {actual_extension.upper()}")
-            if resolved_format.get("format_id"):
-                updated_metadata.append(f"Format ID: {resolved_format['format_id']}")
-            if resolved_format.get("resolution") and resolved_format["resolution"] != "unknown":
-                updated_metadata.append(f"Resolution: {resolved_format['resolution']}")
-            if resolved_format.get("video_codec") and resolved_format["video_codec"] != "unknown":
-                updated_metadata.append(f"Video Codec: {resolved_format['video_codec']}")
-            if resolved_format.get("audio_codec") and resolved_format["audio_codec"] != "unknown":
-                updated_metadata.append(f"Audio Codec: {resolved_format['audio_codec']}")
-            if resolved_format.get("filesize") and resolved_format["filesize"] != "unknown":
-                updated_metadata.append(f"Filesize: {resolved_format['filesize']}")
+            # The format ID is reported even when yt-dlp did not know it.
+            updated_metadata: List[str] = [
+                item
+                for item in job_snapshot.get("metadata") or []
+                if not (isinstance(item, str) and _FORMAT_METADATA_RE.match(item))
+            ] + [
+                f"{label}: {value}"
+                for label, value in (
+                    ("Format", actual_extension.upper()),
+                    ("Format ID", resolved_format.get("format_id")),
+                    ("Resolution", resolved_format.get("resolution")),
+                    ("Video Codec", resolved_format.get("video_codec")),
+                    ("Audio Codec", resolved_format.get("audio_codec")),
+                    ("Filesize", resolved_format.get("filesize")),
+                )
+                if value and (value != "unknown" or label == "Format ID")
+            ]
 
             jobs_repo.update(job_id, {"metadata": updated_metadata})
 
@@ -2512,7 +3390,14 @@ def process_download_job(
         else:
             canonical_filename = canonical_stem
         canonical_path = os.path.join(target_dir, canonical_filename)
-        if os.path.exists(canonical_path):
+        # Both paths are joined onto directories resolved from absolute
+        # library paths, so normalising them is enough to compare.
+        download_key = os.path.normcase(os.path.normpath(target_path))
+        already_canonical = (
+            os.path.normcase(os.path.normpath(canonical_path)) == download_key
+        )
+        # The download itself never counts as a collision with its own name.
+        if not already_canonical and os.path.exists(canonical_path):
             base_name, ext_part = os.path.splitext(canonical_filename)
             log(
                 (
@@ -2520,19 +3405,21 @@ def process_download_job(
                     "Searching for a free name."
                 )
             )
+            taken_names = _existing_names(target_dir)
+            dir_prefix = os.path.join(target_dir, "")
             name_suffix = 1
             while True:
                 new_filename = f"{base_name} ({name_suffix}){ext_part}"
-                candidate = os.path.join(target_dir, new_filename)
-                if not os.path.exists(candidate):
+                if new_filename not in taken_names:
                     canonical_filename = new_filename
-                    canonical_path = candidate
+                    canonical_path = dir_prefix + new_filename
                     log(f"Selected canonical filename '{new_filename}'.")
                     break
                 name_suffix += 1
 
         try:
-            if os.path.abspath(target_path) != os.path.abspath(canonical_path):
+            # A free name picked above never matches the existing download.
+            if not already_canonical:
                 log(
                     f"Renaming downloaded file to canonical name '{canonical_filename}'."
                 )
@@ -2555,27 +3442,24 @@ def process_download_job(
                 pass
             raise JobCancelled()
 
-        for leftover in downloaded_candidates:
-            if os.path.abspath(leftover) == os.path.abspath(target_path):
-                continue
-            if not _is_intermediate_file(leftover):
+        # Leftovers share the selected file's listing, and a renamed download
+        # never lands on another leftover, so plain equality is enough here.
+        for leftover in intermediate_files:
+            if leftover == selected_path:
                 continue
             try:
                 os.remove(leftover)
             except OSError:
                 continue
 
-        if merge_playlist and playlist_temp_dir:
-            try:
-                shutil.rmtree(playlist_temp_dir)
-            except OSError:
-                pass
+        if merge_playlist:
+            _cleanup_playlist_dir(playlist_temp_dir)
 
         _job_status(job_id, "processing", progress=100)
         log(f"Success! Video saved as '{target_path}'.")
         _mark_job_success(job_id)
     except JobCancelled:
-        _cleanup_temp_files(expected_pattern)
+        _cleanup_temp_files(expected_output)
         for candidate in list(downloaded_candidates):
             try:
                 os.remove(candidate)
@@ -2589,6 +3473,8 @@ def process_download_job(
         fail(f"Unexpected error: {exc}")
     # pylint: enable=broad-exception-caught
     finally:
+        metadata_abort.set()
+        job_logs.flush(job_id)
         _clear_job_process(job_id)
         _unregister_job_control(job_id)
 
@@ -2609,6 +3495,7 @@ def cancel_job(job_id: str):
         )
 
     process_to_terminate: Optional[subprocess.Popen] = None
+    queued_future: Optional[Future] = None
     already_requested = False
     with _JOB_CONTROLS_LOCK:
         control = _JOB_CONTROLS.get(job_id)
@@ -2620,10 +3507,20 @@ def cancel_job(job_id: str):
         already_requested = control.cancel_event.is_set()
         control.cancel_event.set()
         process_to_terminate = control.process
+        queued_future = control.future
 
     if process_to_terminate is not None:
         _terminate_process(process_to_terminate)
 
+    if queued_future is not None and queued_future.cancel():
+        # The job never left the queue, so no worker will acknowledge it.
+        append_job_log(job_id, "Cancellation requested by user.")
+        append_job_log(job_id, "Job cancelled.")
+        _mark_job_cancelled(job_id)
+        _unregister_job_control(job_id)
+        updated_job = jobs_repo.get(job_id) or job
+        return jsonify({"job": updated_job, "message": "Cancellation requested."}), 202
+
     message = "Cancellation already requested." if already_requested else "Cancellation requested."
 
     if not already_requested:
@@ -2650,6 +3547,7 @@ def jobs_index():
 def job_detail(job_id: str):
     """Return detailed information for a specific job."""
     config = load_config()
+    job_logs.flush(job_id)
     job = jobs_repo.get(job_id, include_logs=True)
     if job is None:
         return jsonify({"error": "Job not found."}), 404
@@ -2657,6 +3555,14 @@ def job_detail(job_id: str):
     return jsonify({"job": job, "debug_mode": config.get("debug_mode", False)})
 
 
+@lru_cache(maxsize=64)
+def _normalize_remote_path(remote: str) -> Tuple[str, str]:
+    """Return an override's normalized remote path and its child-path prefix."""
+
+    normalized = os.path.normpath(remote).replace("\\", "/")
+    return normalized, normalized + "/"
+
+
 def _resolve_override_target(
     normalized_original: str,
     overrides: Iterable[Dict[str, str]],
@@ -2664,16 +3570,17 @@ def _resolve_override_target(
 ) -> Optional[str]:
     """Return a resolved path using configured override mappings."""
 
+    # Entries were stripped by normalize_path_overrides when the config loaded.
     for override in overrides:
-        remote = (override.get("remote") or "").strip()
-        local = (override.get("local") or "").strip()
+        remote = override.get("remote")
+        local = override.get("local")
         if not remote or not local:
             continue
-        remote_normalized = os.path.normpath(remote).replace("\\", "/")
+        remote_normalized, remote_prefix = _normalize_remote_path(remote)
         if normalized_original == remote_normalized:
             remainder = ""
-        elif normalized_original.startswith(remote_normalized + "/"):
-            remainder = normalized_original[len(remote_normalized) + 1 :]
+        elif normalized_original.startswith(remote_prefix):
+            remainder = normalized_original[len(remote_prefix) :]
         else:
             continue
         candidate = (
@@ -2704,16 +3611,54 @@ def _resolve_library_target(
     search_paths: Iterable[str],
     ensure_candidate: Callable[[str, Optional[str]], Optional[str]],
 ) -> Optional[str]:
-    """Return a resolved path using configured library search paths."""
+    """Return a resolved path using configured library search paths.
 
-    for base_path in search_paths:
+    Folders already known from the library index are checked directly; the
+    ordered scan over every search path only runs on an index miss.
+    """
+
+    paths = tuple(search_paths)
+    folder_index = _library_folder_index(paths)
+    indexed_base = folder_index.get(folder_name)
+    if indexed_base is not None:
+        resolved = ensure_candidate(os.path.join(indexed_base, folder_name), indexed_base)
+        if resolved:
+            return resolved
+        folder_index.pop(folder_name, None)
+
+    for base_path in paths:
         candidate = os.path.join(base_path, folder_name)
         resolved = ensure_candidate(candidate, base_path)
         if resolved:
+            folder_index[folder_name] = base_path
             return resolved
     return None
 
 
+def _library_folder_index(search_paths: Tuple[str, ...]) -> Dict[str, str]:
+    """Return a folder name -> library path map, listing each path once.
+
+    The index is rebuilt when the search paths change or the settings are
+    saved. Entries are only hints: callers still verify the folder exists.
+    """
+
+    cached = _CACHE.get("library_index")
+    if cached is not None and cached[0] == search_paths:
+        return cached[1]
+
+    folder_index: Dict[str, str] = {}
+    for base_path in search_paths:
+        try:
+            with os.scandir(base_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        folder_index.setdefault(entry.name, base_path)
+        except OSError:
+            continue
+    _CACHE["library_index"] = (search_paths, folder_index)
+    return folder_index
+
+
 def resolve_movie_path(
     original_path: Optional[str],
     config: Dict,
@@ -2727,20 +3672,30 @@ def resolve_movie_path(
     """
 
     created = False
+    # Overrides that share a root probe the same base folder repeatedly, so
+    # remember each isdir answer for the duration of this resolve.
+    isdir_cache: Dict[str, bool] = {}
+
+    def is_directory(path: str) -> bool:
+        exists = isdir_cache.get(path)
+        if exists is None:
+            exists = isdir_cache[path] = os.path.isdir(path)
+        return exists
 
     def ensure_candidate(candidate: str, base_dir: Optional[str]) -> Optional[str]:
         nonlocal created
-        if os.path.isdir(candidate):
+        if is_directory(candidate):
             return candidate
         if not create_if_missing:
             return None
         candidate_base = base_dir or os.path.dirname(candidate)
-        if not candidate_base or not os.path.isdir(candidate_base):
+        if not candidate_base or not is_directory(candidate_base):
             return None
         try:
             os.makedirs(candidate, exist_ok=True)
         except OSError:
             return None
+        isdir_cache[candidate] = True
         created = True
         return candidate
 
@@ -2748,14 +3703,8 @@ def resolve_movie_path(
         return None, created
 
     normalized_path = os.path.normpath(str(original_path))
-    resolved_path: Optional[str] = None
-
-    if os.path.isdir(normalized_path):
-        resolved_path = normalized_path
-    else:
-        resolved_path = ensure_candidate(
-            normalized_path, os.path.dirname(normalized_path)
-        )
+    # ensure_candidate returns existing folders as-is after a single isdir.
+    resolved_path = ensure_candidate(normalized_path, os.path.dirname(normalized_path))
 
     if resolved_path is None:
         normalized_original = normalized_path.replace("\\", "/")
@@ -2808,7 +3757,7 @@ def setup():
 
         if not radarr_url:
             errors.append("Radarr URL is required.")
-        elif not re.match(r"^https?://", radarr_url):
+        elif not _RADARR_URL_RE.match(radarr_url):
             errors.append("Radarr URL must start with http:// or https://.")
         if not api_key:
             errors.append("Radarr API key is required.")
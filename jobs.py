@@ -5,11 +5,14 @@ from __future__ import annotations
 import json
 import os
 import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, Iterable, List, Optional
 
 __all__ = [
+    "JobLogBuffer",
     "JobRecord",
     "JobRepository",
     "now_iso",
@@ -88,13 +91,25 @@ class JobRecord:  # pylint: disable=too-many-instance-attributes
 class JobRepository:  # pylint: disable=too-many-instance-attributes
     """Thread-safe JSON-backed job repository."""
 
-    def __init__(self, path: str, *, max_items: int = 50, max_logs: int = 200) -> None:
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_items: int = 50,
+        max_logs: int = 200,
+        flush_interval: float = 0.0,
+    ) -> None:
         self._path = path
         self._max_items = max_items
         self._max_logs = max_logs
+        self._flush_interval = flush_interval
         self._cache: List[JobRecord] = []
         self._loaded = False
+        self._dirty = False
         self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._writer: Optional[threading.Thread] = None
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -114,9 +129,50 @@ class JobRepository:  # pylint: disable=too-many-instance-attributes
         self._loaded = True
 
     def _persist_locked(self) -> None:
-        os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
-        with open(self._path, "w", encoding="utf-8") as handle:
-            json.dump([record.__dict__ for record in self._cache], handle, indent=2)
+        self._dirty = True
+        if self._flush_interval <= 0:
+            self._write_locked()
+            return
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(
+                target=self._run_writer, name="job-history-writer", daemon=True
+            )
+            self._writer.start()
+        self._wakeup.set()
+
+    def _write_locked(self) -> None:
+        self._write_text(self._snapshot_locked())
+
+    def _snapshot_locked(self) -> str:
+        self._dirty = False
+        # jobs.json is rewritten on every batch of updates and is not meant to
+        # be hand-edited, so it is stored compactly.
+        return json.dumps(
+            [record.__dict__ for record in self._cache], separators=(",", ":")
+        )
+
+    def _write_text(self, text: str) -> None:
+        payload = text.encode("utf-8")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        # The config directory normally exists; only create it on a miss.
+        try:
+            fd = os.open(self._path, flags, 0o666)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+            fd = os.open(self._path, flags, 0o666)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+
+    def _run_writer(self) -> None:
+        while True:
+            self._wakeup.wait()
+            # Let further updates accumulate so they share a single write.
+            time.sleep(self._flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except OSError as exc:  # pragma: no cover - disk issues
+                print(f"Failed to save job history: {exc}")
 
     def _insert_locked(self, record: JobRecord) -> JobRecord:
         self._cache.insert(0, record)
@@ -139,6 +195,17 @@ class JobRepository:  # pylint: disable=too-many-instance-attributes
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
+    def flush(self) -> None:
+        """Write any pending changes to disk immediately."""
+
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                text = self._snapshot_locked()
+            # Writing outside the state lock keeps updates from blocking on disk.
+            self._write_text(text)
+
     def create(self, job_data: Dict) -> Dict:
         """Add a job to the history and return its serialised form."""
 
@@ -158,7 +225,8 @@ class JobRepository:  # pylint: disable=too-many-instance-attributes
         with self._lock:
             self._ensure_loaded()
             items = [record.to_dict(include_logs=include_logs) for record in self._cache]
-        items.sort(key=lambda entry: entry.get("created_at") or "", reverse=True)
+        # created_at is always populated by JobRecord.from_dict and create().
+        items.sort(key=itemgetter("created_at"), reverse=True)
         return items
 
     def get(self, job_id: str, *, include_logs: bool = False) -> Optional[Dict]:
@@ -294,3 +362,90 @@ class JobRepository:  # pylint: disable=too-many-instance-attributes
         if progress is not None:
             updates["progress"] = progress
         return self.update(job_id, updates)
+
+
+class JobLogBuffer:  # pylint: disable=too-many-instance-attributes
+    """Collect job log lines in memory and persist them in batches.
+
+    Lines are written to the repository by a background thread ``interval``
+    seconds after they are queued, or immediately once a job has
+    ``max_pending`` unsaved lines; it sleeps while nothing is queued.
+    Rewrites of an already persisted last line, such as download progress
+    updates, are coalesced so only the newest one is written per flush.
+    Callers should :meth:`flush` a job before recording a terminal status so
+    its log is complete.
+    """
+
+    def __init__(
+        self,
+        repository: JobRepository,
+        *,
+        interval: float = 0.25,
+        max_pending: int = 64,
+    ) -> None:
+        self._repository = repository
+        self._interval = interval
+        self._max_pending = max_pending
+        self._pending: Dict[str, List[str]] = {}
+        self._replacements: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def _schedule_flush_locked(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run, name="job-log-flush", daemon=True
+            )
+            self._worker.start()
+        self._wakeup.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait()
+            time.sleep(self._interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except OSError as exc:  # pragma: no cover - disk issues
+                print(f"Failed to persist job logs: {exc}")
+
+    def _flush_locked(self, job_ids: Iterable[str]) -> None:
+        for job_id in list(job_ids):
+            replacement = self._replacements.pop(job_id, None)
+            if replacement is not None:
+                self._repository.replace_last_log(job_id, replacement)
+            messages = self._pending.pop(job_id, None)
+            if messages:
+                self._repository.append_logs(job_id, messages)
+
+    def append(self, job_id: str, message: str) -> None:
+        """Queue a log line for the job."""
+
+        with self._lock:
+            pending = self._pending.setdefault(job_id, [])
+            pending.append(str(message))
+            if len(pending) >= self._max_pending:
+                self._flush_locked([job_id])
+                return
+            self._schedule_flush_locked()
+
+    def replace_last(self, job_id: str, message: str) -> None:
+        """Overwrite the most recent log line, whether pending or persisted."""
+
+        with self._lock:
+            pending = self._pending.get(job_id)
+            if pending:
+                pending[-1] = str(message)
+                return
+            self._replacements[job_id] = str(message)
+            self._schedule_flush_locked()
+
+    def flush(self, job_id: Optional[str] = None) -> None:
+        """Persist pending lines for one job, or for every job when omitted."""
+
+        with self._lock:
+            if job_id is None:
+                self._flush_locked(set(self._pending) | set(self._replacements))
+            else:
+                self._flush_locked([job_id])